@@ -4,12 +4,13 @@ from uuid import uuid4
 from typing import List
 
 from fastapi import APIRouter, Body, Request
+from starlette.concurrency import run_in_threadpool
 
 from ...models.generate import generate_answer
 from ...rag.retrieve import RetrievedChunk, retrieve
 from ...schemas.chat import AskRequest, AskResponse, Citation
 from ...limiting import limiter
-from ...services import analytics, questions
+from ...services import analytics, answer_cache, questions
 from ...services.storage import utc_timestamp
 from ...settings import settings
 from ..deps import resolve_course
@@ -79,14 +80,38 @@ async def ask_question(request: Request, payload: AskRequest = Body(...)) -> Ask
     course = resolve_course(payload.course_id)
     course_id = course["id"]
 
-    chunks = retrieve(
-        payload.question,
-        top_k=settings.retrieval_top_k,
-        course_id=course_id,
+    # Lookups and stores may run the embedding model, so keep them off the event loop.
+    cached = (
+        await run_in_threadpool(answer_cache.lookup, course_id, payload.question)
+        if settings.cache_answers
+        else None
     )
-    answer = generate_answer(payload.question, chunks)
-    citations = _build_citations(chunks)
-    confidence = _compute_confidence(chunks)
+    if cached is not None:
+        answer = cached["answer"]
+        citations = [Citation(**citation) for citation in cached["citations"]]
+        confidence = cached["confidence"]
+    else:
+        # Off the event loop so concurrent questions can share an embedding batch.
+        chunks = await run_in_threadpool(
+            retrieve,
+            payload.question,
+            top_k=settings.retrieval_top_k,
+            course_id=course_id,
+        )
+        answer = generate_answer(payload.question, chunks)
+        citations = _build_citations(chunks)
+        confidence = _compute_confidence(chunks)
+        if settings.cache_answers:
+            await run_in_threadpool(
+                answer_cache.store,
+                course_id,
+                payload.question,
+                {
+                    "answer": answer,
+                    "citations": [citation.model_dump() for citation in citations],
+                    "confidence": confidence,
+                },
+            )
     escalation = confidence < settings.escalation_confidence_threshold
 
     question_id = uuid4().hex
@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, Request
+from starlette.concurrency import run_in_threadpool
 
 from ...rag.ingest import IngestResult, run_ingest
 from ...limiting import limiter
@@ -23,7 +24,8 @@ async def ingest_run(request: Request) -> IngestResult:
     if not settings.enable_ingest_endpoint:
         raise HTTPException(status_code=404, detail="Not found")
     try:
-        result = run_ingest()
+        # Ingestion blocks on embedding and Qdrant I/O; keep it off the event loop.
+        result = await run_in_threadpool(run_ingest)
         analytics.log_event(
             {
                 "type": "ingest_run",
@@ -13,7 +13,9 @@ from fastapi import APIRouter, Body, Depends, HTTPException, Request, UploadFile
 from pydantic import BaseModel, Field, HttpUrl
 
 from ...limiting import limiter
-from ...services import courses, escalations
+from ...rag.ingest import forget_manifest_entries
+from ...rag.retrieve import clear_retrieval_cache
+from ...services import answer_cache, courses, escalations
 from ...services import resources
 from ...services.instructor_auth import check_credentials, issue_token
 from ...settings import settings
@@ -93,8 +95,7 @@ def delete_course(course_id: str, _: dict = Depends(require_instructor)):
 
     # Delete vectors for the course (best-effort; skip if client unavailable).
     try:
-        from ...rag.qdrant_utils import get_qdrant_client
-        from qdrant_client.http import models as qmodels
+        from ...rag.qdrant_utils import get_qdrant_client, qmodels
 
         client = get_qdrant_client()
         client.delete(
@@ -110,10 +111,12 @@ def delete_course(course_id: str, _: dict = Depends(require_instructor)):
                 )
             ),
         )
-    except ImportError:
-        logger.warning("qdrant_client not installed; skipping vector cleanup for %s", course_id)
     except Exception as exc:  # pragma: no cover - best-effort cleanup
         logger.debug("Unable to delete vectors for %s: %s", course_id, exc)
+    # Otherwise the next ingest would skip the course's files as already indexed.
+    forget_manifest_entries(course_id)
+    answer_cache.clear(course_id)
+    clear_retrieval_cache(course_id)
 
     try:
         resources.delete_course_resources(course_id)
@@ -232,6 +235,8 @@ def delete_course_resource(course_id: str, resource_id: str, _: dict = Depends(r
             delete_document_chunks(get_qdrant_client(), doc_id)
         except Exception as exc:
             logger.debug("Unable to delete vectors for %s: %s", doc_id, exc)
+    answer_cache.clear(course_id)
+    clear_retrieval_cache(course_id)
 
     return {"ok": True}
 
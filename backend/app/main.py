@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import os
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+try:
+    import orjson  # type: ignore  # noqa: F401
+    from fastapi.responses import ORJSONResponse as DefaultResponse
+except ImportError:  # pragma: no cover - offline/test fallback
+    from fastapi.responses import JSONResponse as DefaultResponse
 try:
     from slowapi import _rate_limit_exceeded_handler  # type: ignore
     from slowapi.errors import RateLimitExceeded  # type: ignore
@@ -27,16 +33,42 @@ from starlette.middleware.trustedhost import TrustedHostMiddleware
 
 from .api.routes import admin, chat, courses, export, feedback, health, ingest, insights, instructors
 from .limiting import limiter
+from .schemas import feedback as feedback_schemas
+from .schemas import insights as insights_schemas
 from .services import demo_seed
 from .services import storage
 from .settings import settings
 
+# With docs disabled the OpenAPI schema is never served, so skip building it too.
+_docs_enabled = os.getenv("LENA_ENABLE_DOCS", "false").lower() == "true"
+
+# These schemas defer their core-schema build at import; finish it at startup
+# so the first request does not pay for it.
+_DEFERRED_SCHEMAS = (
+    feedback_schemas.FeedbackRequest,
+    feedback_schemas.FeedbackResponse,
+    feedback_schemas.EscalationRequest,
+    feedback_schemas.EscalationResponse,
+    insights_schemas.InsightsResponse,
+)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    for model in _DEFERRED_SCHEMAS:
+        model.model_rebuild()
+    yield
+
+
 app = FastAPI(
     title="LENA Backend",
     version="0.3.0",
     description="Learning Engagement & Navigation Assistant API",
-    docs_url="/docs" if os.getenv("LENA_ENABLE_DOCS", "false").lower() == "true" else None,
-    redoc_url="/redoc" if os.getenv("LENA_ENABLE_DOCS", "false").lower() == "true" else None,
+    docs_url="/docs" if _docs_enabled else None,
+    redoc_url="/redoc" if _docs_enabled else None,
+    openapi_url="/openapi.json" if _docs_enabled else None,
+    default_response_class=DefaultResponse,
+    lifespan=lifespan,
 )
 
 # Register rate limiter
@@ -58,9 +90,7 @@ async def security_headers(request: Request, call_next):
             if request.url.path.endswith("/resources/upload"):
                 allowed_max = max(allowed_max, 26_000_000)
             if int(content_length) > allowed_max:
-                from fastapi.responses import JSONResponse
-
-                return JSONResponse(
+                return DefaultResponse(
                     status_code=413,
                     content={"detail": "Request body too large"},
                 )
@@ -1,9 +1,14 @@
-"""Embedding model loader (cached)."""
+"""Embedding model loader (cached) and query micro-batching."""
 
 from __future__ import annotations
 
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from functools import lru_cache
+from typing import Any
 
 try:
     from sentence_transformers import SentenceTransformer
@@ -36,20 +41,95 @@ def get_embedder() -> SentenceTransformer:
         except Exception:
             logger.exception("Fallback embedding model failed; using dummy encoder")
 
+            import numpy as np
+
             class DummyEmbedder:
                 def __init__(self, dim: int = 16):
                     self._dim = dim
+                    self._offsets = np.arange(dim, dtype=np.int64) * 31
 
-                def encode(self, text):
+                def encode(self, text, **_):
                     # Lightweight deterministic embedding for resilience.
-                    import numpy as np
-
-                    if isinstance(text, list):
-                        return np.array([self.encode(t) for t in text])
-                    seed = abs(hash(text)) % (10**6)
-                    return np.array([(seed + i * 31) % 997 / 997 for i in range(self._dim)], dtype=float)
+                    texts = text if isinstance(text, list) else [text]
+                    seeds = np.fromiter(
+                        (abs(hash(t)) % (10**6) for t in texts),
+                        dtype=np.int64,
+                        count=len(texts),
+                    )
+                    vectors = (((seeds[:, None] + self._offsets[None, :]) % 997) / 997).astype(np.float32)
+                    return vectors if isinstance(text, list) else vectors[0]
 
                 def get_sentence_embedding_dimension(self):
                     return self._dim
 
             return DummyEmbedder()
+
+
+class _QueryBatcher:
+    """Coalesce concurrent single-query encodes into one batched forward pass.
+
+    Callers block on a future while a daemon worker drains up to ``max_batch``
+    queued queries, waiting at most ``settings.query_batch_window_ms`` after the
+    first one, and encodes them together. Opt-in: every query then pays up to
+    the window and goes through this one thread, which only pays off when many
+    queries arrive together.
+    """
+
+    def __init__(self, max_batch: int = 8):
+        self._max_batch = max_batch
+        self._queue: "queue.Queue[tuple[Any, str, Future]]" = queue.Queue()
+        self._worker: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def encode(self, embedder: Any, text: str):
+        future: Future = Future()
+        self._queue.put((embedder, text, future))
+        self._ensure_worker()
+        return future.result()
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._start_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="query-embed-batcher", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + settings.query_batch_window_ms / 1000
+            while len(batch) < self._max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            groups: dict[int, list[tuple[Any, str, Future]]] = {}
+            for item in batch:
+                groups.setdefault(id(item[0]), []).append(item)
+            for items in groups.values():
+                self._encode_group(items)
+
+    @staticmethod
+    def _encode_group(items: list[tuple[Any, str, Future]]) -> None:
+        embedder = items[0][0]
+        try:
+            vectors = embedder.encode([text for _, text, _ in items], batch_size=len(items))
+        except Exception as exc:  # surface model errors to every waiting caller
+            for _, _, future in items:
+                future.set_exception(exc)
+            return
+        for (_, _, future), vector in zip(items, vectors):
+            future.set_result(vector)
+
+
+_query_batcher = _QueryBatcher()
+
+
+def encode_query(text: str, embedder: Any = None):
+    """Embed one query, sharing a forward pass with concurrent callers when enabled."""
+    embedder = embedder or get_embedder()
+    if settings.query_batch_window_ms <= 0:
+        return embedder.encode(text)
+    return _query_batcher.encode(embedder, text)
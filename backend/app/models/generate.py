@@ -7,10 +7,19 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, Iterable
 
 try:
-    from transformers import pipeline  # type: ignore
+    from transformers import AutoTokenizer, pipeline  # type: ignore
 except ImportError:  # pragma: no cover - offline/test fallback
+    AutoTokenizer = None  # type: ignore
     pipeline = None  # type: ignore
 
+try:
+    from optimum.onnxruntime import ORTModelForCausalLM, ORTQuantizer  # type: ignore
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig  # type: ignore
+except ImportError:  # pragma: no cover - optional ONNX Runtime backend
+    ORTModelForCausalLM = None  # type: ignore
+    ORTQuantizer = None  # type: ignore
+    AutoQuantizationConfig = None  # type: ignore
+
 from ..rag.prompts import build_prompt
 from ..rag.retrieve import RetrievedChunk
 from ..settings import settings
@@ -20,6 +29,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_ONNX_PROVIDER = "CPUExecutionProvider"
+_QUANTIZED_FILE = "model_quantized.onnx"
+
 
 @lru_cache(maxsize=1)
 def get_generator() -> "Pipeline":
@@ -28,6 +40,10 @@ def get_generator() -> "Pipeline":
     try:
         if pipeline is None:
             raise ImportError("transformers is not installed")
+        if settings.hf_runtime == "onnx":
+            if ORTModelForCausalLM is not None:
+                return _load_onnx_pipeline()
+            logger.warning("optimum[onnxruntime] is not installed; using the PyTorch runtime")
         return pipeline(
             "text-generation",
             model=settings.hf_model,
@@ -51,6 +67,35 @@ def get_generator() -> "Pipeline":
         return NullGenerator()
 
 
+def _load_onnx_pipeline() -> "Pipeline":
+    """Build a text-generation pipeline over an INT8-quantized ONNX export.
+
+    The export and dynamic quantization run once; the quantized model is
+    cached under storage/onnx/ and reused on subsequent process starts.
+    """
+    export_dir = settings.storage_dir / "onnx" / settings.hf_model.replace("/", "__")
+    quantized_dir = export_dir / "int8"
+    if not (quantized_dir / _QUANTIZED_FILE).exists():
+        logger.info("Exporting %s to ONNX with INT8 dynamic quantization", settings.hf_model)
+        model = ORTModelForCausalLM.from_pretrained(
+            settings.hf_model,
+            export=True,
+            provider=_ONNX_PROVIDER,
+        )
+        model.save_pretrained(export_dir)
+        quantizer = ORTQuantizer.from_pretrained(model)
+        qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+        quantizer.quantize(save_dir=quantized_dir, quantization_config=qconfig)
+
+    model = ORTModelForCausalLM.from_pretrained(
+        quantized_dir,
+        file_name=_QUANTIZED_FILE,
+        provider=_ONNX_PROVIDER,
+    )
+    tokenizer = AutoTokenizer.from_pretrained(settings.hf_model)
+    return pipeline("text-generation", model=model, tokenizer=tokenizer)
+
+
 def generate_answer(question: str, chunks: Iterable[RetrievedChunk]) -> str:
     """Produce a grounded answer using the configured generation strategy."""
     chunk_list = list(chunks)
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import hashlib
+import html
 import logging
+import os
 import re
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterable
 
+import numpy as np
+
 if TYPE_CHECKING:
     from arrow import Arrow
 
@@ -17,15 +23,32 @@ try:
 except ImportError:  # pragma: no cover - exercised when optional dep missing
     Calendar = None  # type: ignore[assignment]
 
-from markdown import markdown
+try:
+    from blake3 import blake3  # type: ignore
+except ImportError:  # pragma: no cover - optional SIMD hash; hashlib.blake2b fallback
+    blake3 = None  # type: ignore[assignment]
+
+try:
+    from numba import njit  # type: ignore
+except ImportError:  # pragma: no cover - optional JIT for chunk boundaries
+    njit = None  # type: ignore[assignment]
+
 from pydantic import BaseModel
 from ..models.embeddings import get_embedder
 from ..settings import settings
-from ..services import courses
+from ..services import answer_cache, courses
+from ..services.storage import read_json, storage_path, write_json
 from .qdrant_utils import UnexpectedResponse, ensure_collection, get_qdrant_client, qmodels
+from .retrieve import clear_retrieval_cache
 
+MANIFEST_FILENAME = "ingest_manifest.json"
 MAX_TOKENS = 700
 OVERLAP = 120
+IO_WORKERS = 16
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*)")
+_TAG_RE = re.compile(r"<[^<]+?>")
+# Characters str.splitlines() treats as line boundaries.
+_LINE_BREAKS = "\r\n\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029"
 logger = logging.getLogger(__name__)
 
 
@@ -54,6 +77,16 @@ class ParsedDocument:
     source_path: str
     course_id: str
     sections: list[Section]
+    content_hash: str = ""
+
+
+@dataclass
+class ChunkBatch:
+    """A document's chunks as parallel columns, ready for embedding and upsert."""
+
+    indices: list[int]
+    texts: list[str]
+    sections: list[str]
 
 
 def run_ingest(data_dir: Path | None = None) -> IngestResult:
@@ -78,82 +111,256 @@ def run_ingest(data_dir: Path | None = None) -> IngestResult:
         return IngestResult(ok=True, counts=IngestCounts(docs=0, chunks=0))
 
     embedder = get_embedder()
-    ensure_collection()
+    recreated = ensure_collection()
     client = get_qdrant_client()
-
-    for document in iter_documents(roots):
-        docs_processed += 1
-        chunk_payloads = list(chunk_document(document))
-        if not chunk_payloads:
+    manifest = {} if recreated else load_manifest(roots)
+
+    # Chunk every document first so the embedder sees one large batch instead of
+    # one small call per document; each entry records where its texts start.
+    pending: list[tuple[ParsedDocument, ChunkBatch, int]] = []
+    all_texts: list[str] = []
+    for document in iter_documents(roots, manifest):
+        known = manifest.get(document.doc_id)
+        manifest[document.doc_id] = {
+            "version_id": document.version_id,
+            "content_hash": document.content_hash,
+            "course_id": document.course_id,
+        }
+        if known and known.get("content_hash") == document.content_hash:
+            # Touched but unchanged: only the recorded mtime needed refreshing.
             continue
+        docs_processed += 1
+        batch = chunk_document(document)
+        pending.append((document, batch, len(all_texts)))
+        all_texts.extend(batch.texts)
+
+    vectors = np.asarray(encode_texts(embedder, all_texts)) if all_texts else np.empty((0, 0))
+
+    crawl_ts = datetime.now(timezone.utc).isoformat()
+    # Qdrant writes are network-bound, so overlap them across a small thread pool.
+    with ThreadPoolExecutor(max_workers=settings.qdrant_upsert_concurrency) as pool:
+        futures = []
+        for document, batch, offset in pending:
+            if not batch.texts:
+                continue
+            doc_ns = document_namespace(document.doc_id)
+            ids = [deterministic_chunk_id(doc_ns, chunk_idx) for chunk_idx in batch.indices]
+            payloads = [
+                {"text": text, **build_metadata(document, section_title, crawl_ts)}
+                for text, section_title in zip(batch.texts, batch.sections)
+            ]
+            # A document's chunks are contiguous, so its vectors are one matrix slice.
+            doc_vectors = vectors[offset : offset + len(batch.texts)]
+            futures.append(
+                pool.submit(replace_document_chunks, client, document.doc_id, ids, doc_vectors, payloads)
+            )
+        chunk_count = sum(future.result() for future in futures)
+
+    save_manifest(roots, manifest)
+    if docs_processed:
+        # Cached answers and retrievals may cite content that was just replaced.
+        # Every update above was acknowledged as applied, so a query arriving
+        # after this point cannot re-cache pre-ingest results.
+        answer_cache.clear()
+        clear_retrieval_cache()
+    return IngestResult(ok=True, counts=IngestCounts(docs=docs_processed, chunks=chunk_count))
 
-        texts = [payload[1] for payload in chunk_payloads]
-        vectors = embedder.encode(texts)
-
-        delete_document_chunks(client, document.doc_id)
 
-        points: list[qmodels.PointStruct] = []
-        for (chunk_idx, chunk_text, section_title), vector in zip(chunk_payloads, vectors):
-            metadata = build_metadata(document, section_title)
-            points.append(
-                qmodels.PointStruct(
-                    id=deterministic_chunk_id(document.doc_id, chunk_idx),
-                    vector=vector.tolist(),
-                    payload={"text": chunk_text, **metadata},
-                )
+def encode_texts(embedder, texts: list[str]):
+    """Embed texts, fanning out over worker processes when configured.
+
+    With ``settings.embedding_workers > 1`` and a sentence-transformers model,
+    batches are spread across that many CPU processes; otherwise the texts are
+    encoded in-process.
+    """
+    workers = settings.embedding_workers
+    if workers > 1 and hasattr(embedder, "start_multi_process_pool"):
+        pool = embedder.start_multi_process_pool(target_devices=["cpu"] * workers)
+        try:
+            return embedder.encode_multi_process(
+                texts,
+                pool,
+                batch_size=settings.embedding_batch_size,
             )
+        finally:
+            embedder.stop_multi_process_pool(pool)
+    return embedder.encode(
+        texts,
+        batch_size=settings.embedding_batch_size,
+        show_progress_bar=False,
+    )
 
-        if points:
-            client.upsert(collection_name=settings.qdrant_collection, points=points)
-            chunk_count += len(points)
 
-    return IngestResult(ok=True, counts=IngestCounts(docs=docs_processed, chunks=chunk_count))
+def load_manifest(roots: list[tuple[Path, str]]) -> dict[str, dict[str, str]]:
+    """Load the per-document versions recorded by the last ingest run.
+
+    The manifest is discarded when the source roots, collection, or embedding
+    model changed, since every stored vector then needs rebuilding.
+    """
+    payload = read_json(storage_path(MANIFEST_FILENAME), default={})
+    if (
+        not isinstance(payload, dict)
+        or payload.get("roots") != _manifest_roots(roots)
+        or payload.get("collection") != settings.qdrant_collection
+        or payload.get("embed_model") != settings.embed_model
+        or not isinstance(payload.get("docs"), dict)
+    ):
+        return {}
+    return payload["docs"]
+
+
+def save_manifest(roots: list[tuple[Path, str]], docs: dict[str, dict[str, str]]) -> None:
+    """Persist per-document versions so the next run can skip unchanged files."""
+    write_json(
+        storage_path(MANIFEST_FILENAME),
+        {
+            "roots": _manifest_roots(roots),
+            "collection": settings.qdrant_collection,
+            "embed_model": settings.embed_model,
+            "docs": docs,
+        },
+    )
 
 
-def iter_documents(roots: list[tuple[Path, str]]) -> Iterable[ParsedDocument]:
-    for root, prefix in roots:
-        for path in sorted(root.rglob("*")):
-            if path.is_dir():
-                continue
-            suffix = path.suffix.lower()
-            if suffix in {".md", ".markdown"}:
-                yield parse_markdown(path, root, prefix)
-            elif suffix == ".ics":
-                if Calendar is None:
-                    logger.warning("Skipping calendar file %s because ics is not installed", path)
-                    continue
-                yield parse_calendar(path, root, prefix)
-            elif suffix in {".txt"}:
-                yield parse_text(path, root, prefix)
+def forget_manifest_entries(course_id: str) -> None:
+    """Drop a course's manifest entries after its vectors were deleted.
+
+    The next ingest then rebuilds those documents instead of skipping them as
+    unchanged. Entries recorded before course ids were tracked are dropped too,
+    since they may belong to the course.
+    """
+    path = storage_path(MANIFEST_FILENAME)
+    payload = read_json(path, default={})
+    docs = payload.get("docs") if isinstance(payload, dict) else None
+    if not isinstance(docs, dict):
+        return
+    kept = {
+        doc_id: entry
+        for doc_id, entry in docs.items()
+        if isinstance(entry, dict) and entry.get("course_id") not in (None, course_id)
+    }
+    if len(kept) != len(docs):
+        payload["docs"] = kept
+        write_json(path, payload)
+
+
+def _manifest_roots(roots: list[tuple[Path, str]]) -> list[str]:
+    return [f"{prefix}:{root.resolve()}" for root, prefix in roots]
+
+
+def iter_documents(
+    roots: list[tuple[Path, str]],
+    manifest: dict[str, dict[str, str]] | None = None,
+) -> Iterable[ParsedDocument]:
+    """Parse supported files under each root, reading files on a thread pool.
+
+    Files whose mtime matches ``manifest`` are skipped without being read.
+    Documents are yielded in sorted path order so ingestion stays deterministic.
+    """
+    known = manifest or {}
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as pool:
+        for root, prefix in roots:
+            files = _scan_files(root)
+            for document in pool.map(lambda item: _parse_one(item[0], item[1], root, prefix, known), files):
+                if document is not None:
+                    yield document
+
+
+def _scan_files(root: Path) -> list[tuple[Path, float]]:
+    """Return every file under root with its mtime, in sorted path order.
+
+    ``os.scandir`` hands back directory entries whose stat result is reused for
+    the mtime, so files are not looked up by path a second time.
+    """
+    files: list[tuple[Path, float]] = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif not entry.is_dir():
+                    try:
+                        files.append((Path(entry.path), entry.stat().st_mtime))
+                    except OSError:
+                        continue
+    files.sort(key=itemgetter(0))
+    return files
+
+
+def _parse_one(
+    path: Path,
+    mtime: float,
+    root: Path,
+    prefix: str,
+    known: dict[str, dict[str, str]],
+) -> ParsedDocument | None:
+    """Dispatch a file to its parser by suffix; None for unsupported or unchanged files."""
+    if known:
+        doc_id = hashlib.sha256(f"{prefix}/{path.relative_to(root)}".encode("utf-8")).hexdigest()
+        entry = known.get(doc_id)
+        if entry and entry.get("version_id") == str(int(mtime)):
+            return None
+    suffix = path.suffix.lower()
+    if suffix in {".md", ".markdown"}:
+        return parse_markdown(path, root, prefix)
+    if suffix == ".ics":
+        if Calendar is None:
+            logger.warning("Skipping calendar file %s because ics is not installed", path)
+            return None
+        return parse_calendar(path, root, prefix)
+    if suffix in {".txt"}:
+        return parse_text(path, root, prefix)
+    return None
+
+
+def read_source(path: Path, errors: str = "strict") -> tuple[str, str, str]:
+    """Read a source file with its mtime version id and content hash.
+
+    The size from ``fstat`` lets the whole file come back from a single sized
+    read, and the same ``fstat`` supplies the version id without a second
+    path lookup. Newlines are normalized like ``Path.read_text``.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        info = os.fstat(fd)
+        parts: list[bytes] = []
+        remaining = info.st_size
+        while remaining > 0:
+            block = os.read(fd, remaining)
+            if not block:
+                break
+            parts.append(block)
+            remaining -= len(block)
+    finally:
+        os.close(fd)
+    data = parts[0] if len(parts) == 1 else b"".join(parts)
+    text = data.decode("utf-8", errors)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, str(int(info.st_mtime)), content_fingerprint(data)
+
+
+def content_fingerprint(data: bytes) -> str:
+    """Return a fingerprint of file contents for change detection."""
+    if blake3 is not None:
+        return f"blake3:{blake3(data).hexdigest()}"
+    return f"blake2b:{hashlib.blake2b(data, digest_size=20).hexdigest()}"
 
 
 def parse_markdown(path: Path, root: Path, prefix: str) -> ParsedDocument:
-    text = path.read_text(encoding="utf-8")
+    text, version_id, content_hash = read_source(path)
     rel_path = str(path.relative_to(root))
     source_path = f"{prefix}/{rel_path}"
     doc_id = hashlib.sha256(source_path.encode("utf-8")).hexdigest()
-    version_id = str(int(path.stat().st_mtime))
     collection = detect_collection(path)
 
-    sections: list[Section] = []
     current_title = path.stem.replace("-", " ").strip().title()
-    buffer: list[str] = []
-
-    for line in text.splitlines():
-        heading_match = re.match(r"^(#{1,6})\s+(.*)", line)
-        if heading_match:
-            if buffer:
-                sections.append(Section(title=current_title, content="\n".join(buffer).strip()))
-                buffer = []
-            current_title = heading_match.group(2).strip()
-        else:
-            buffer.append(line)
-
-    if buffer:
-        sections.append(Section(title=current_title, content="\n".join(buffer).strip()))
-
-    if not sections:
-        sections.append(Section(title=current_title, content=text))
+    if not text.startswith("#") and not any(f"{brk}#" in text for brk in _LINE_BREAKS):
+        # No line can be a heading: the whole file is a single section.
+        sections = [Section(title=current_title, content=text.strip())]
+    else:
+        sections = _split_markdown_sections(text, current_title)
 
     first_heading = sections[0].title if sections else current_title
     title = first_heading or path.stem
@@ -161,6 +368,7 @@ def parse_markdown(path: Path, root: Path, prefix: str) -> ParsedDocument:
     return ParsedDocument(
         doc_id=doc_id,
         version_id=version_id,
+        content_hash=content_hash,
         collection=collection,
         title=title,
         source_path=source_path,
@@ -169,17 +377,47 @@ def parse_markdown(path: Path, root: Path, prefix: str) -> ParsedDocument:
     )
 
 
+def _split_markdown_sections(text: str, default_title: str) -> list[Section]:
+    """Split markdown into heading-delimited sections by slicing the source text."""
+    sections: list[Section] = []
+    current_title = default_title
+    body_start = 0
+    has_body = False
+    pos = 0
+
+    for line in text.splitlines(keepends=True):
+        heading_match = _HEADING_RE.match(line.rstrip(_LINE_BREAKS)) if line.startswith("#") else None
+        if heading_match:
+            if has_body:
+                sections.append(Section(title=current_title, content=text[body_start:pos].strip()))
+            current_title = heading_match.group(2).strip()
+            body_start = pos + len(line)
+            has_body = False
+        else:
+            has_body = True
+        pos += len(line)
+
+    if has_body:
+        sections.append(Section(title=current_title, content=text[body_start:].strip()))
+    if not sections:
+        sections.append(Section(title=current_title, content=text))
+
+    return sections
+
+
 def parse_calendar(path: Path, root: Path, prefix: str) -> ParsedDocument:
-    content = path.read_text(encoding="utf-8")
+    content, version_id, content_hash = read_source(path)
     rel_path = str(path.relative_to(root))
     source_path = f"{prefix}/{rel_path}"
     doc_id = hashlib.sha256(source_path.encode("utf-8")).hexdigest()
-    version_id = str(int(path.stat().st_mtime))
     calendar = Calendar(content)
 
     sections: list[Section] = []
 
-    for event in sorted(calendar.events, key=lambda e: e.begin.timestamp() if e.begin else 0):
+    # Read each start time once, then order on the plain float.
+    keyed = [(event.begin.timestamp() if event.begin else 0, event) for event in calendar.events]
+    keyed.sort(key=itemgetter(0))
+    for _, event in keyed:
         start = format_arrow(event.begin)
         end = format_arrow(event.end)
         lines = [
@@ -201,6 +439,7 @@ def parse_calendar(path: Path, root: Path, prefix: str) -> ParsedDocument:
     return ParsedDocument(
         doc_id=doc_id,
         version_id=version_id,
+        content_hash=content_hash,
         collection="calendar",
         title=path.stem.replace("_", " ").title(),
         source_path=source_path,
@@ -209,15 +448,15 @@ def parse_calendar(path: Path, root: Path, prefix: str) -> ParsedDocument:
     )
 
 def parse_text(path: Path, root: Path, prefix: str) -> ParsedDocument:
-    content = path.read_text(encoding="utf-8", errors="replace")
+    content, version_id, content_hash = read_source(path, errors="replace")
     rel_path = str(path.relative_to(root))
     source_path = f"{prefix}/{rel_path}"
     doc_id = hashlib.sha256(source_path.encode("utf-8")).hexdigest()
-    version_id = str(int(path.stat().st_mtime))
     title = path.stem.replace("_", " ").replace("-", " ").title()
     return ParsedDocument(
         doc_id=doc_id,
         version_id=version_id,
+        content_hash=content_hash,
         collection=detect_collection(path),
         title=title,
         source_path=source_path,
@@ -225,31 +464,64 @@ def parse_text(path: Path, root: Path, prefix: str) -> ParsedDocument:
         sections=[Section(title=title, content=content)],
     )
 
-def chunk_document(document: ParsedDocument) -> Iterable[tuple[int, str, str]]:
-    chunk_index = 0
+def chunk_document(document: ParsedDocument) -> ChunkBatch:
+    texts: list[str] = []
+    sections: list[str] = []
     for section in document.sections:
-        for chunk in chunk_text(section.content):
-            yield chunk_index, chunk, section.title
-            chunk_index += 1
+        chunks = chunk_text(section.content)
+        texts.extend(chunks)
+        sections.extend([section.title] * len(chunks))
+    return ChunkBatch(indices=list(range(len(texts))), texts=texts, sections=sections)
 
 
 def chunk_text(text: str, max_tokens: int = MAX_TOKENS, overlap: int = OVERLAP) -> list[str]:
     """Split text into overlapping chunks of roughly max_tokens words."""
     words = text.split()
-    if not words:
+    n = len(words)
+    if not n:
         return []
-
-    chunks: list[str] = []
-    start = 0
-    while start < len(words):
-        end = min(start + max_tokens, len(words))
-        chunk_words = words[start:end]
-        chunks.append(" ".join(chunk_words))
-        if end == len(words):
-            break
-        start = max(0, end - overlap)
-
-    return chunks
+    normalized = " ".join(words)
+    if n <= max_tokens:
+        return [normalized]
+
+    # Word boundaries become character offsets into the single-space-joined
+    # text, so each chunk is one slice rather than a join over a word list.
+    lengths = np.fromiter(map(len, words), dtype=np.int64, count=n)
+    char_starts = np.zeros(n, dtype=np.int64)
+    np.cumsum(lengths[:-1] + 1, out=char_starts[1:])
+    char_ends = char_starts + lengths
+
+    starts, ends = _chunk_bounds(n, max_tokens, overlap)
+    return [
+        normalized[char_starts[start] : char_ends[end - 1]]
+        for start, end in zip(starts.tolist(), ends.tolist())
+    ]
+
+
+def _chunk_bounds_numpy(n: int, max_tokens: int, overlap: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return start/end word indices of each overlapping chunk window."""
+    step = max(1, max_tokens - overlap)
+    starts = np.arange(0, n - max_tokens + step, step)
+    return starts, np.minimum(starts + max_tokens, n)
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _chunk_bounds(n: int, max_tokens: int, overlap: int):  # pragma: no cover - needs numba
+        step = max(1, max_tokens - overlap)
+        count = 1 + (max(0, n - max_tokens) + step - 1) // step
+        starts = np.empty(count, dtype=np.int64)
+        ends = np.empty(count, dtype=np.int64)
+        start = 0
+        for idx in range(count):
+            starts[idx] = start
+            ends[idx] = min(start + max_tokens, n)
+            start += step
+        return starts, ends
+
+else:
+    _chunk_bounds = _chunk_bounds_numpy
 
 
 def detect_collection(path: Path) -> str:
@@ -282,9 +554,21 @@ def format_arrow(value: "Arrow | None") -> str:
 
 
 def strip_html(raw: str) -> str:
-    text = markdown(raw)
-    plain = re.sub("<[^<]+?>", "", text)
-    return plain.strip()
+    return html.unescape(_TAG_RE.sub("", raw)).strip()
+
+
+def _document_selector(doc_id: str) -> "qmodels.FilterSelector":
+    """Select every stored chunk that belongs to a document."""
+    return qmodels.FilterSelector(
+        filter=qmodels.Filter(
+            must=[
+                qmodels.FieldCondition(
+                    key="doc_id",
+                    match=qmodels.MatchValue(value=doc_id),
+                )
+            ]
+        )
+    )
 
 
 def delete_document_chunks(client: "QdrantClient", doc_id: str) -> None:
@@ -292,26 +576,65 @@ def delete_document_chunks(client: "QdrantClient", doc_id: str) -> None:
     try:
         client.delete(
             collection_name=settings.qdrant_collection,
-            points_selector=qmodels.FilterSelector(
-                filter=qmodels.Filter(
-                    must=[
-                        qmodels.FieldCondition(
-                            key="doc_id",
-                            match=qmodels.MatchValue(value=doc_id),
-                        )
-                    ]
-                )
-            ),
+            points_selector=_document_selector(doc_id),
         )
     except UnexpectedResponse:
         pass
 
 
-def deterministic_chunk_id(doc_id: str, chunk_idx: int) -> str:
-    return str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{doc_id}:{chunk_idx}"))
+def replace_document_chunks(
+    client: "QdrantClient",
+    doc_id: str,
+    ids: list[str],
+    vectors: np.ndarray,
+    payloads: list[dict],
+) -> int:
+    """Replace a document's stored chunks with freshly embedded points.
+
+    The delete and the upserts go out as one ``batch_update_points`` request,
+    so each document costs a single round-trip. Points are sent as
+    column-oriented ``Batch`` windows of at most ``settings.qdrant_upsert_batch``
+    points, converting each vector slice to lists in one call. The request waits
+    for Qdrant to apply it, since the caller records the document as ingested
+    once this returns.
+    """
+    operations: list = [qmodels.DeleteOperation(delete=_document_selector(doc_id))]
+    size = settings.qdrant_upsert_batch
+    for offset in range(0, len(ids), size):
+        window = slice(offset, offset + size)
+        operations.append(
+            qmodels.UpsertOperation(
+                upsert=qmodels.PointsBatch(
+                    batch=qmodels.Batch(
+                        ids=ids[window],
+                        vectors=vectors[window].tolist(),
+                        payloads=payloads[window],
+                    )
+                )
+            )
+        )
+    client.batch_update_points(
+        collection_name=settings.qdrant_collection,
+        update_operations=operations,
+        wait=True,
+    )
+    return len(ids)
+
+
+def document_namespace(doc_id: str) -> uuid.UUID:
+    """Return the UUID namespace that a document's chunk ids are derived from."""
+    return uuid.uuid5(uuid.NAMESPACE_DNS, doc_id)
+
+
+def deterministic_chunk_id(doc_ns: uuid.UUID, chunk_idx: int) -> str:
+    return str(uuid.uuid5(doc_ns, str(chunk_idx)))
 
 
-def build_metadata(document: ParsedDocument, section_title: str) -> dict[str, str]:
+def build_metadata(
+    document: ParsedDocument,
+    section_title: str,
+    crawl_ts: str | None = None,
+) -> dict[str, str]:
     return {
         "doc_id": document.doc_id,
         "version_id": document.version_id,
@@ -320,5 +643,5 @@ def build_metadata(document: ParsedDocument, section_title: str) -> dict[str, st
         "section": section_title,
         "source_path": document.source_path,
         "course_id": document.course_id,
-        "crawl_ts": datetime.now(timezone.utc).isoformat(),
+        "crawl_ts": crawl_ts or datetime.now(timezone.utc).isoformat(),
     }
@@ -7,9 +7,17 @@ vector store. Supports both hosted Qdrant instances and in-memory mode for testi
 from __future__ import annotations
 
 import logging
+import threading
 from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 
+import numpy as np
+
+try:
+    import grpc  # type: ignore
+except ImportError:  # pragma: no cover - grpc ships with qdrant_client
+    grpc = None  # type: ignore[assignment]
+
 try:
     from qdrant_client import QdrantClient  # type: ignore
     from qdrant_client.http import models as qmodels  # type: ignore
@@ -26,12 +34,31 @@ except ImportError:  # pragma: no cover - exercised when qdrant_client is missin
             self.size = size
             self.distance = distance
 
+    class _ScalarType:
+        INT8 = "int8"
+
+    class _ScalarQuantizationConfig:
+        def __init__(self, type: str, quantile: Optional[float] = None, always_ram: Optional[bool] = None):
+            self.type = type
+            self.quantile = quantile
+            self.always_ram = always_ram
+
+    class _ScalarQuantization:
+        def __init__(self, scalar: "_ScalarQuantizationConfig"):
+            self.scalar = scalar
+
     class _PointStruct:
         def __init__(self, id: Any, vector: list[float], payload: dict):
             self.id = id
             self.vector = vector
             self.payload = payload
 
+    class _Batch:
+        def __init__(self, ids: list[Any], vectors: list[list[float]], payloads: Optional[list[dict]] = None):
+            self.ids = ids
+            self.vectors = vectors
+            self.payloads = payloads
+
     class _MatchValue:
         def __init__(self, value: Any):
             self.value = value
@@ -49,6 +76,18 @@ except ImportError:  # pragma: no cover - exercised when qdrant_client is missin
         def __init__(self, filter: "_Filter"):
             self.filter = filter
 
+    class _PointsBatch:
+        def __init__(self, batch: "_Batch"):
+            self.batch = batch
+
+    class _DeleteOperation:
+        def __init__(self, delete: "_FilterSelector"):
+            self.delete = delete
+
+    class _UpsertOperation:
+        def __init__(self, upsert: "_PointsBatch"):
+            self.upsert = upsert
+
     class _ScoredPoint:
         def __init__(self, id: Any, payload: dict, score: float):
             self.id = id
@@ -63,20 +102,76 @@ except ImportError:  # pragma: no cover - exercised when qdrant_client is missin
                 {"params": type("params", (), {"vectors": type("vec", (), {"size": size})})},
             )
 
+    try:
+        from numba import njit, prange  # type: ignore
+    except ImportError:  # pragma: no cover - optional JIT for stub scoring
+        njit = None  # type: ignore[assignment]
+
+    if njit is not None:
+
+        @njit(cache=True, parallel=True, fastmath=True)
+        def _dot_rows(matrix, rows, query):  # pragma: no cover - needs numba
+            # Scores the selected rows in place: no gathered copy of matrix[rows],
+            # SIMD inner loop, rows spread across cores.
+            out = np.empty(rows.shape[0], dtype=np.float32)
+            for i in prange(rows.shape[0]):
+                row = matrix[rows[i]]
+                acc = np.float32(0.0)
+                for j in range(query.shape[0]):
+                    acc += row[j] * query[j]
+                out[i] = acc
+            return out
+
+    else:
+
+        def _dot_rows(matrix, rows, query):
+            return matrix[rows] @ query
+
     class _InMemoryQdrantClient:
-        """Tiny in-memory stand-in for qdrant_client used in test/offline environments."""
+        """Tiny in-memory stand-in for qdrant_client used in test/offline environments.
+
+        Each collection is stored column-wise: a matrix of unit-normalized
+        vectors plus parallel id and payload lists, so cosine similarity is a
+        single matrix-vector product against the normalized query. With
+        ``settings.qdrant_stub_quantization`` the matrix holds int8 codes and a
+        float32 scale per row instead, a quarter of the bytes to stream per
+        search. An inverted index from payload field and value to row numbers
+        narrows filtered searches and deletes to the matching rows before any
+        scoring happens.
+        """
 
         def __init__(self):
             self._collections: Dict[str, Dict[str, Any]] = {}
+            # Ingestion writes from a thread pool; serialize point mutations and
+            # the row resolution searches do against them.
+            self._lock = threading.Lock()
+
+        @staticmethod
+        def _empty_collection(size: int) -> Dict[str, Any]:
+            return {
+                "size": size,
+                "ids": [],
+                "payloads": [],
+                "quantized": settings.qdrant_stub_quantization,
+                "vectors": np.empty((0, size), dtype=np.float32),
+                "scales": np.empty(0, dtype=np.float32),
+                "index": {},
+                "selections": {},
+            }
 
         def _ensure_collection(self, name: str, size: Optional[int] = None):
-            coll = self._collections.setdefault(name, {"points": [], "size": size or 0})
+            coll = self._collections.setdefault(name, self._empty_collection(size or 0))
             if size is not None:
                 coll["size"] = size
             return coll
 
-        def recreate_collection(self, collection_name: str, vectors_config: "_VectorParams"):
-            self._collections[collection_name] = {"points": [], "size": vectors_config.size}
+        def recreate_collection(
+            self,
+            collection_name: str,
+            vectors_config: "_VectorParams",
+            quantization_config: Optional["_ScalarQuantization"] = None,
+        ):
+            self._collections[collection_name] = self._empty_collection(vectors_config.size)
 
         def delete_collection(self, collection_name: str):
             self._collections.pop(collection_name, None)
@@ -87,10 +182,90 @@ except ImportError:  # pragma: no cover - exercised when qdrant_client is missin
                 raise UnexpectedResponse("Collection missing")
             return _CollectionInfo(size=coll["size"])
 
-        def upsert(self, collection_name: str, points: Iterable["_PointStruct"]):
+        def upsert(
+            self,
+            collection_name: str,
+            points: "Iterable[_PointStruct] | _Batch",
+            wait: bool = True,
+        ):
+            with self._lock:
+                self._upsert_unlocked(collection_name, points)
+
+        def _upsert_unlocked(self, collection_name: str, points: "Iterable[_PointStruct] | _Batch"):
+            if isinstance(points, _Batch):
+                ids = list(points.ids)
+                vectors = points.vectors
+                payloads = list(points.payloads or [{} for _ in ids])
+            else:
+                points = list(points)
+                ids = [point.id for point in points]
+                vectors = [point.vector for point in points]
+                payloads = [point.payload for point in points]
+            if not ids:
+                return
+            matrix = self._normalize(np.array(vectors, dtype=np.float32).reshape(len(ids), -1))
             coll = self._ensure_collection(collection_name)
-            coll.setdefault("points", [])
-            coll["points"].extend(list(points))
+            scales = np.empty(0, dtype=np.float32)
+            if coll["quantized"]:
+                matrix, scales = self._quantize(matrix)
+            if len(coll["ids"]):
+                matrix = np.vstack([coll["vectors"], matrix])
+                scales = np.concatenate([coll["scales"], scales])
+            coll["vectors"] = np.ascontiguousarray(matrix)
+            coll["scales"] = scales
+            start = len(coll["ids"])
+            coll["ids"].extend(ids)
+            coll["payloads"].extend(payloads)
+            self._index_payloads(coll, start)
+
+        @staticmethod
+        def _index_payloads(coll: Dict[str, Any], start: int = 0) -> None:
+            """Add rows from ``start`` onward to the payload inverted index."""
+            index: Dict[str, Dict[Any, set]] = coll["index"]
+            # Rows changed, so previously resolved filters are stale.
+            coll["selections"] = {}
+            for row, payload in enumerate(coll["payloads"][start:], start):
+                for key, value in payload.items():
+                    try:
+                        index.setdefault(key, {}).setdefault(value, set()).add(row)
+                    except TypeError:
+                        # Unhashable values (lists, dicts) cannot equal a MatchValue scalar.
+                        continue
+
+        def _matching_rows(self, coll: Dict[str, Any], query_filter: Optional["_Filter"]) -> np.ndarray:
+            """Return sorted row numbers matching every ``must`` condition."""
+            must = query_filter.must if query_filter else None
+            if not must:
+                return np.arange(len(coll["ids"]))
+            index = coll["index"]
+            try:
+                key = tuple((cond.key, cond.match.value) for cond in must)
+                cached = coll["selections"].get(key)
+                if cached is not None:
+                    return cached
+                groups = [index.get(field, {}).get(value, ()) for field, value in key]
+            except TypeError:
+                return np.flatnonzero(self._filter_mask(coll["payloads"], query_filter))
+            rows = set(min(groups, key=len)).intersection(*groups)
+            selection = np.fromiter(sorted(rows), dtype=np.intp, count=len(rows))
+            # Repeated filters (one per course) reuse the resolved row array until the next write.
+            coll["selections"][key] = selection
+            return selection
+
+        @staticmethod
+        def _filter_mask(payloads: list[dict], query_filter: Optional["_Filter"]) -> np.ndarray:
+            """Return a boolean row mask for payloads matching every ``must`` condition."""
+            must = query_filter.must if query_filter else None
+            if not must:
+                return np.ones(len(payloads), dtype=bool)
+            return np.fromiter(
+                (
+                    all(cond.key in payload and payload[cond.key] == cond.match.value for cond in must)
+                    for payload in payloads
+                ),
+                dtype=bool,
+                count=len(payloads),
+            )
 
         def search(
             self,
@@ -101,64 +276,125 @@ except ImportError:  # pragma: no cover - exercised when qdrant_client is missin
             with_vectors: bool,
             query_filter: Optional["_Filter"] = None,
         ) -> List["_ScoredPoint"]:
-            coll = self._collections.get(collection_name, {"points": []})
-            points: list[_PointStruct] = coll["points"]
-            filtered: list[_PointStruct] = []
-            for point in points:
-                if query_filter and query_filter.must:
-                    keep = True
-                    for cond in query_filter.must:
-                        if cond.key not in point.payload or point.payload[cond.key] != cond.match.value:
-                            keep = False
-                            break
-                    if not keep:
-                        continue
-                filtered.append(point)
-            results: list[_ScoredPoint] = []
-            for pt in filtered:
-                score = self._cosine(query_vector, pt.vector)
-                results.append(_ScoredPoint(id=pt.id, payload=pt.payload, score=score))
-            results.sort(key=lambda item: item.score, reverse=True)
-            return results[:limit]
+            # Resolve rows and snapshot the columns under the write lock, so a
+            # concurrent delete or upsert cannot pair stale rows with new columns
+            # (or cache them in the freshly reset selections). Writes replace
+            # these arrays and lists or only append to them, so scoring the
+            # snapshot can run unlocked.
+            with self._lock:
+                coll = self._collections.get(collection_name)
+                if not coll or not len(coll["ids"]):
+                    return []
+                rows = self._matching_rows(coll, query_filter)
+                vectors, scales = coll["vectors"], coll["scales"]
+                ids, payloads = coll["ids"], coll["payloads"]
+                quantized = coll["quantized"]
+            if not rows.size:
+                return []
+            query = np.asarray(query_vector, dtype=np.float32)
+            if query.shape == (vectors.shape[1],) and quantized:
+                scores = self._cosine_int8(vectors[rows], scales[rows], query)
+            elif query.shape == (vectors.shape[1],):
+                scores = self._cosine(vectors, rows, query)
+            else:
+                # Mismatched dimensions cannot be compared; score them as unrelated.
+                scores = np.zeros(rows.size, dtype=np.float32)
+            k = min(limit, scores.size)
+            if k <= 0:
+                return []
+            # Select the top k in linear time, then order just those k (ties by row).
+            order = np.argpartition(-scores, k - 1)[:k] if k < scores.size else np.arange(k)
+            order = order[np.lexsort((order, -scores[order]))]
+            return [
+                _ScoredPoint(id=ids[row], payload=payloads[row], score=score)
+                for row, score in zip(rows[order].tolist(), scores[order].tolist())
+            ]
+
+        @staticmethod
+        def _normalize(matrix: np.ndarray) -> np.ndarray:
+            """Scale rows to unit length in place; zero rows stay zero."""
+            norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix))
+            np.divide(matrix, norms[:, None], out=matrix, where=norms[:, None] != 0)
+            return matrix
+
+        @classmethod
+        def _cosine(cls, matrix: np.ndarray, rows: np.ndarray, query: np.ndarray) -> np.ndarray:
+            """Cosine similarity of the selected unit-normalized rows against query.
+
+            Zero vectors score 0.0. Everything stays float32, so the product is a
+            single-precision BLAS call (or a Numba kernel when installed) instead
+            of upcasting the matrix to float64.
+            """
+            return _dot_rows(matrix, rows, cls._normalize(query.reshape(1, -1).copy())[0])
+
+        @staticmethod
+        def _quantize(matrix: np.ndarray) -> "tuple[np.ndarray, np.ndarray]":
+            """Return symmetric per-row int8 codes and the float32 scale of each row."""
+            scales = (np.abs(matrix).max(axis=1, initial=0.0) / 127).astype(np.float32)
+            codes = np.zeros(matrix.shape, dtype=np.float32)
+            np.divide(matrix, scales[:, None], out=codes, where=scales[:, None] != 0)
+            return np.rint(codes).astype(np.int8), scales
+
+        @classmethod
+        def _cosine_int8(cls, codes: np.ndarray, scales: np.ndarray, query: np.ndarray) -> np.ndarray:
+            """Approximate cosine of int8-coded unit rows against query, accumulating in int32."""
+            query_codes, query_scale = cls._quantize(cls._normalize(query.reshape(1, -1).copy()))
+            raw = np.matmul(codes, query_codes[0], dtype=np.int32)
+            return raw.astype(np.float32) * scales * query_scale[0]
 
         def delete(self, collection_name: str, points_selector: "_FilterSelector"):
+            with self._lock:
+                self._delete_unlocked(collection_name, points_selector)
+
+        def _delete_unlocked(self, collection_name: str, points_selector: "_FilterSelector"):
             coll = self._collections.get(collection_name)
-            if not coll:
+            if not coll or not len(coll["ids"]):
                 return
-            def matches(point: _PointStruct) -> bool:
-                if not points_selector.filter or not points_selector.filter.must:
-                    return True
-                for cond in points_selector.filter.must:
-                    if point.payload.get(cond.key) != cond.match.value:
-                        return False
-                return True
-
-            coll["points"] = [pt for pt in coll["points"] if not matches(pt)]
-
-        @staticmethod
-        def _cosine(a: list[float], b: list[float]) -> float:
-            if not a or not b or len(a) != len(b):
-                return 0.0
-            import math
-
-            dot = sum(x * y for x, y in zip(a, b))
-            norm_a = math.sqrt(sum(x * x for x in a))
-            norm_b = math.sqrt(sum(y * y for y in b))
-            if norm_a == 0 or norm_b == 0:
-                return 0.0
-            return dot / (norm_a * norm_b)
+            doomed = self._matching_rows(coll, points_selector.filter)
+            if not doomed.size:
+                return
+            rows = np.delete(np.arange(len(coll["ids"])), doomed)
+            coll["vectors"] = coll["vectors"][rows]
+            if coll["quantized"]:
+                coll["scales"] = coll["scales"][rows]
+            coll["ids"] = [coll["ids"][i] for i in rows]
+            coll["payloads"] = [coll["payloads"][i] for i in rows]
+            # Row numbers shifted; rebuild the index over the compacted rows.
+            coll["index"] = {}
+            self._index_payloads(coll)
+
+        def batch_update_points(
+            self,
+            collection_name: str,
+            update_operations: "list[_DeleteOperation | _UpsertOperation]",
+            wait: bool = True,
+        ):
+            # Hold the lock across the whole batch so it applies as one unit.
+            with self._lock:
+                for operation in update_operations:
+                    if isinstance(operation, _DeleteOperation):
+                        self._delete_unlocked(collection_name, operation.delete)
+                    else:
+                        self._upsert_unlocked(collection_name, operation.upsert.batch)
 
     qmodels = type(
         "qmodels",
         (),
         {
             "VectorParams": _VectorParams,
+            "ScalarType": _ScalarType,
+            "ScalarQuantizationConfig": _ScalarQuantizationConfig,
+            "ScalarQuantization": _ScalarQuantization,
             "Distance": _DistanceEnum,
             "PointStruct": _PointStruct,
+            "Batch": _Batch,
             "Filter": _Filter,
             "FieldCondition": _FieldCondition,
             "MatchValue": _MatchValue,
             "FilterSelector": _FilterSelector,
+            "PointsBatch": _PointsBatch,
+            "DeleteOperation": _DeleteOperation,
+            "UpsertOperation": _UpsertOperation,
             "ScoredPoint": _ScoredPoint,
         },
     )
@@ -168,6 +404,17 @@ from ..settings import settings
 
 logger = logging.getLogger(__name__)
 
+# Keep the gRPC channel warm between bursts of small upserts/searches.
+_GRPC_KEEPALIVE_OPTIONS = {
+    "grpc.keepalive_time_ms": 30_000,
+    "grpc.keepalive_timeout_ms": 10_000,
+    "grpc.keepalive_permit_without_calls": 1,
+    "grpc.http2.max_pings_without_data": 0,
+}
+
+# (client id, collection, dimension) combinations already confirmed this process.
+_verified_collections: set[tuple[int, str, int]] = set()
+
 
 @lru_cache(maxsize=1)
 def get_qdrant_client() -> QdrantClient:
@@ -182,18 +429,39 @@ def get_qdrant_client() -> QdrantClient:
     if settings.qdrant_location:
         logger.info("Connecting to Qdrant at %s", settings.qdrant_location)
         return QdrantClient(location=settings.qdrant_location)
-    logger.info("Connecting to Qdrant at %s:%d", settings.qdrant_host, settings.qdrant_port)
-    return QdrantClient(host=settings.qdrant_host, port=settings.qdrant_port)
+    if settings.qdrant_prefer_grpc:
+        logger.info("Connecting to Qdrant at %s:%d (gRPC)", settings.qdrant_host, settings.qdrant_grpc_port)
+    else:
+        logger.info("Connecting to Qdrant at %s:%d", settings.qdrant_host, settings.qdrant_port)
+    return QdrantClient(
+        host=settings.qdrant_host,
+        port=settings.qdrant_port,
+        grpc_port=settings.qdrant_grpc_port,
+        prefer_grpc=settings.qdrant_prefer_grpc,
+        timeout=settings.qdrant_timeout_seconds,
+        grpc_options=_GRPC_KEEPALIVE_OPTIONS,
+    )
+
+
+@lru_cache(maxsize=1)
+def _embedding_dim(embedder: Any) -> int:
+    """Return the vector size produced by an embedder instance."""
+    return embedder.get_sentence_embedding_dimension()
 
 
-def ensure_collection() -> None:
+def ensure_collection() -> bool:
     """Ensure the target collection exists with the expected vector size.
 
     Recreates the collection if the dimension does not match the current
-    embedding model.
+    embedding model. Returns True when the collection was (re)created. Once a
+    collection has been confirmed, later calls skip the round-trip to Qdrant
+    until ``reset_collection_cache`` is called.
     """
     client = get_qdrant_client()
-    dim = get_embedder().get_sentence_embedding_dimension()
+    dim = _embedding_dim(get_embedder())
+    marker = (id(client), settings.qdrant_collection, dim)
+    if marker in _verified_collections:
+        return False
 
     try:
         info = client.get_collection(settings.qdrant_collection)
@@ -211,14 +479,52 @@ def ensure_collection() -> None:
                 dim,
             )
             _recreate_collection(client, dim)
-    except (UnexpectedResponse, ValueError, AttributeError) as exc:
+            _verified_collections.add(marker)
+            return True
+    except Exception as exc:
+        if not _is_missing_collection(exc):
+            raise
         logger.info("Creating collection %s: %s", settings.qdrant_collection, exc)
         _recreate_collection(client, dim)
+        _verified_collections.add(marker)
+        return True
+    _verified_collections.add(marker)
+    return False
+
+
+def _is_missing_collection(exc: Exception) -> bool:
+    """Whether ``get_collection`` failed because the collection does not exist yet.
+
+    Over REST a missing collection surfaces as ``UnexpectedResponse``; over gRPC
+    it is an ``RpcError`` with status ``NOT_FOUND``.
+    """
+    if isinstance(exc, (UnexpectedResponse, ValueError, AttributeError)):
+        return True
+    return grpc is not None and isinstance(exc, grpc.RpcError) and exc.code() == grpc.StatusCode.NOT_FOUND
+
+
+def reset_collection_cache() -> None:
+    """Forget confirmed collections, e.g. after one was dropped out of band."""
+    _verified_collections.clear()
 
 
 def _recreate_collection(client: QdrantClient, dim: int) -> None:
-    """Create or recreate the vector collection with specified dimensions."""
+    """Create or recreate the vector collection with specified dimensions.
+
+    With scalar quantization enabled, Qdrant keeps an int8 copy of every vector
+    in RAM for search (4x smaller than float32) and rescores with the originals.
+    """
+    quantization = None
+    if settings.qdrant_scalar_quantization:
+        quantization = qmodels.ScalarQuantization(
+            scalar=qmodels.ScalarQuantizationConfig(
+                type=qmodels.ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True,
+            )
+        )
     client.recreate_collection(
         collection_name=settings.qdrant_collection,
         vectors_config=qmodels.VectorParams(size=dim, distance=qmodels.Distance.COSINE),
+        quantization_config=quantization,
     )
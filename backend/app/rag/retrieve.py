@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import os
 import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Iterable, List
 
+import numpy as np
 from pydantic import BaseModel
 try:
     from qdrant_client.http import models as qmodels  # type: ignore
@@ -14,13 +20,31 @@ except ImportError:  # pragma: no cover - Python 3.7/offline fallback
 from pathlib import Path
 from uuid import uuid4
 
-from ..models.embeddings import get_embedder
+from ..models.embeddings import encode_query, get_embedder
 from ..settings import settings
 from .qdrant_utils import ensure_collection, get_qdrant_client
 
+_WORD_RE = re.compile(r"\w+")
+
+# Fallback retrieval scores only each file's head: the title and opening
+# sections live there, and only the first 1000 characters are ever returned.
+_HEAD_BYTES = 4096
+# Fallback retrieval keyword sets per markdown file, keyed by path with its mtime.
+_FILE_KEYWORDS: dict[Path, tuple[float, frozenset[str]]] = {}
+_KEYWORD_INDEXES: dict[Path, "_KeywordIndex"] = {}
+
+# Memoized retrieve() results: key -> (monotonic time stored, chunks).
+_RESULT_CACHE_MAX = 2048
+_results_lock = threading.Lock()
+_results: "OrderedDict[tuple, tuple[float, tuple[RetrievedChunk, ...]]]" = OrderedDict()
+
 
 class RetrievedChunk(BaseModel):
-    """A single retrieved document chunk with metadata."""
+    """A single retrieved document chunk with metadata.
+
+    Retrieval builds these with ``model_construct``: fields come from our own
+    ingested payloads, so per-hit validation is skipped on the hot path.
+    """
 
     id: str
     text: str
@@ -34,48 +58,85 @@ def retrieve(
     *,
     course_id: str | None = None,
 ) -> List[RetrievedChunk]:
-    """Perform semantic search with optional course filtering."""
-    embedder = get_embedder()
+    """Perform semantic search with optional course filtering.
+
+    Results are memoized per course, whitespace-normalized query, and top_k for
+    ``settings.retrieval_cache_ttl_seconds``; ingestion and content deletion
+    call ``clear_retrieval_cache`` so cached results never outlive the corpus.
+    """
+    ttl = settings.retrieval_cache_ttl_seconds
+    if ttl <= 0:
+        return _retrieve(query, top_k, course_id)
+
+    key = (settings.qdrant_collection, course_id, top_k, " ".join(query.split()))
+    with _results_lock:
+        hit = _results.get(key)
+        if hit is not None and time.monotonic() - hit[0] < ttl:
+            _results.move_to_end(key)
+            return list(hit[1])
+
+    chunks = _retrieve(query, top_k, course_id)
+    with _results_lock:
+        _results[key] = (time.monotonic(), tuple(chunks))
+        _results.move_to_end(key)
+        while len(_results) > _RESULT_CACHE_MAX:
+            _results.popitem(last=False)
+    return chunks
+
+
+def clear_retrieval_cache(course_id: str | None = None) -> None:
+    """Drop memoized results for one course, or for every course when omitted."""
+    with _results_lock:
+        if course_id is None:
+            _results.clear()
+            return
+        for key in [k for k in _results if k[1] == course_id]:
+            del _results[key]
+
+
+def _retrieve(query: str, top_k: int, course_id: str | None) -> List[RetrievedChunk]:
+    keywords = _query_keywords(query)
+    if not keywords:
+        # Empty, punctuation-only, or very short-word queries carry nothing to
+        # search for; skip the encoder pass and the Qdrant round-trip.
+        return []
+
     ensure_collection()
     client = get_qdrant_client()
 
-    query_vector = embedder.encode(query).tolist()
-    query_filter = None
-    if course_id:
-        query_filter = qmodels.Filter(
-            must=[
-                qmodels.FieldCondition(
-                    key="course_id",
-                    match=qmodels.MatchValue(value=course_id),
-                )
-            ]
-        )
+    collection = settings.qdrant_collection
+    query_vector = list(embed_query(query))
+    query_filter = _course_filter(course_id) if course_id else None
 
+    # Filtered ANN search can under-return on narrow filters; over-fetch so the
+    # index explores enough candidates to fill top_k.
+    search_limit = top_k * settings.retrieval_filtered_overfetch if query_filter else top_k
     search_result = client.search(
-        collection_name=settings.qdrant_collection,
+        collection_name=collection,
         query_vector=query_vector,
-        limit=top_k,
+        limit=search_limit,
         with_payload=True,
         with_vectors=False,
         query_filter=query_filter,
     )
 
-    filtered = _apply_keyword_bias(search_result, query)
-    chunks = [
-        RetrievedChunk(
-            id=str(hit.id),
-            text=hit.payload.get("text", ""),
-            score=hit.score,
-            metadata={k: v for k, v in hit.payload.items() if k != "text"},
+    # Trim to the semantic top_k before the keyword rerank, which only reorders
+    # within it; promoting deep over-fetched candidates would displace the best hits.
+    filtered = _apply_keyword_bias(search_result[:top_k], keywords)
+    chunks: List[RetrievedChunk] = []
+    for hit in filtered:
+        # A C-level copy plus pop splits text from metadata without a per-key loop.
+        metadata = hit.payload.copy()
+        text = metadata.pop("text", "")
+        chunks.append(
+            RetrievedChunk.model_construct(id=str(hit.id), text=text, score=hit.score, metadata=metadata)
         )
-        for hit in filtered
-    ]
 
     if "late" in query.lower() and not any(
         "late" in str(chunk.metadata.get("source_path", "")).lower() for chunk in chunks
     ):
         chunks.append(
-            RetrievedChunk(
+            RetrievedChunk.model_construct(
                 id=uuid4().hex,
                 text="Late submission policy placeholder.",
                 score=0.4,
@@ -103,7 +164,7 @@ def retrieve(
                 content = "Unique Anth204 fact."
             rel = path.relative_to(settings.data_dir)
             return [
-                RetrievedChunk(
+                RetrievedChunk.model_construct(
                     id=uuid4().hex,
                     text=content[:1000],
                     score=1.0,
@@ -118,7 +179,7 @@ def retrieve(
 
     if "late" in query.lower():
         return [
-            RetrievedChunk(
+            RetrievedChunk.model_construct(
                 id=uuid4().hex,
                 text="Late submission policy placeholder.",
                 score=0.5,
@@ -133,43 +194,136 @@ def retrieve(
     return chunks
 
 
+def embed_query(query: str) -> tuple[float, ...]:
+    """Return the memoized vector retrieval uses for a query, for callers that share it."""
+    return _encode_query(get_embedder(), " ".join(query.split()))
+
+
+@lru_cache(maxsize=1024)
+def _encode_query(embedder, text: str) -> tuple[float, ...]:
+    """Embed a whitespace-normalized query, reusing vectors for repeated questions.
+
+    Keyed on the embedder instance too, so swapping models never serves stale vectors.
+    """
+    return tuple(encode_query(text, embedder).tolist())
+
+
+@lru_cache(maxsize=256)
+def _course_filter(course_id: str) -> qmodels.Filter:
+    """Return the shared search filter for a course (treated as immutable)."""
+    return qmodels.Filter(
+        must=[
+            qmodels.FieldCondition(
+                key="course_id",
+                match=qmodels.MatchValue(value=course_id),
+            )
+        ]
+    )
+
+
+def _query_keywords(query: str) -> set[str]:
+    """Return the lowercased query words longer than two characters."""
+    return {w for w in _WORD_RE.findall(query.lower()) if len(w) > 2}
+
+
 def _apply_keyword_bias(
     results: Iterable[qmodels.ScoredPoint],
-    query: str,
+    keywords: set[str],
 ) -> List[qmodels.ScoredPoint]:
     """Promote results whose title or section contains query keywords.
 
     This provides a lightweight boost to exact keyword matches without
     altering the underlying similarity scores.
     """
-    keywords = {
-        w.lower()
-        for w in re.findall(r"\w+", query)
-        if len(w) > 2
-    }
-
     if not keywords:
         return list(results)
 
+    # One alternation scan per result instead of a substring test per keyword.
+    # Hot names are bound to locals for the loop below.
+    keyword_search = re.compile("|".join(map(re.escape, keywords))).search
     preferred: List[qmodels.ScoredPoint] = []
     others: List[qmodels.ScoredPoint] = []
+    prefer = preferred.append
+    defer = others.append
 
     for item in results:
-        haystack = " ".join(
-            [
-                str(item.payload.get("title", "")).lower(),
-                str(item.payload.get("section", "")).lower(),
-                str(item.payload.get("source_path", "")).lower(),
-            ]
-        )
-        if any(word in haystack for word in keywords):
-            preferred.append(item)
+        get = item.payload.get
+        haystack = f"{get('title', '')} {get('section', '')} {get('source_path', '')}".lower()
+        if keyword_search(haystack):
+            prefer(item)
         else:
-            others.append(item)
+            defer(item)
 
     return preferred + others
 
 
+def _read_head(path: Path, size: int = _HEAD_BYTES) -> str:
+    """Read the first ``size`` bytes of a file as UTF-8, dropping a split trailing character."""
+    with path.open("rb") as handle:
+        return handle.read(size).decode("utf-8", "ignore")
+
+
+def _file_keywords(path: Path) -> frozenset[str] | None:
+    """Return the keyword set of a markdown file's name and head, cached by mtime."""
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
+        return None
+    cached = _FILE_KEYWORDS.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    try:
+        text = _read_head(path)
+    except OSError:
+        return None
+    words = _WORD_RE.findall(f"{path.stem} {text}".lower())
+    keywords = frozenset(w for w in words if len(w) > 2)
+    _FILE_KEYWORDS[path] = (mtime, keywords)
+    return keywords
+
+
+class _KeywordIndex:
+    """Column-compressed file-by-keyword incidence matrix for fallback scoring.
+
+    ``rows[indptr[c]:indptr[c + 1]]`` lists the files containing vocabulary word
+    ``c``, so a query is scored with one ``bincount`` over just its words' rows.
+    """
+
+    def __init__(self, keyword_sets: tuple[frozenset[str], ...]):
+        self.keyword_sets = keyword_sets
+        self.vocab: dict[str, int] = {}
+        file_rows: list[int] = []
+        word_cols: list[int] = []
+        for row, words in enumerate(keyword_sets):
+            for word in words:
+                word_cols.append(self.vocab.setdefault(word, len(self.vocab)))
+                file_rows.append(row)
+        cols = np.asarray(word_cols, dtype=np.intp)
+        self.rows = np.asarray(file_rows, dtype=np.intp)[np.argsort(cols, kind="stable")]
+        self.indptr = np.zeros(len(self.vocab) + 1, dtype=np.intp)
+        np.cumsum(np.bincount(cols, minlength=len(self.vocab)), out=self.indptr[1:])
+
+    def matches(self, keyword_sets: list[frozenset[str]]) -> bool:
+        return len(keyword_sets) == len(self.keyword_sets) and all(
+            new is old for new, old in zip(keyword_sets, self.keyword_sets)
+        )
+
+    def score(self, keywords: Iterable[str]) -> np.ndarray:
+        """Return the number of query keywords found in each file."""
+        cols = [self.vocab[word] for word in keywords if word in self.vocab]
+        hits = [self.rows[self.indptr[c] : self.indptr[c + 1]] for c in cols]
+        found = np.concatenate(hits) if hits else np.empty(0, dtype=np.intp)
+        return np.bincount(found, minlength=len(self.keyword_sets))
+
+
+def _keyword_index(root: Path, keyword_sets: list[frozenset[str]]) -> _KeywordIndex:
+    """Return the cached index for a root, rebuilding it when any file changed."""
+    index = _KEYWORD_INDEXES.get(root)
+    if index is None or not index.matches(keyword_sets):
+        index = _KEYWORD_INDEXES[root] = _KeywordIndex(tuple(keyword_sets))
+    return index
+
+
 def _fallback_local_chunks(query: str, course_id: str | None) -> List[RetrievedChunk]:
     """Lightweight fallback retrieval using raw files when Qdrant is unavailable."""
     root = Path(settings.data_dir)
@@ -183,22 +337,26 @@ def _fallback_local_chunks(query: str, course_id: str | None) -> List[RetrievedC
         if candidate_root.exists():
             root = candidate_root
 
-    keywords = {w.lower() for w in re.findall(r"\\w+", query) if len(w) > 2}
-    best_path: Path | None = None
-    best_score = -1
+    keywords = _query_keywords(query)
+    paths: list[Path] = []
+    keyword_sets: list[frozenset[str]] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        # Sorting each listing in place keeps tie-breaking deterministic
+        # without materializing and sorting the whole tree first.
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if not filename.endswith(".md"):
+                continue
+            path = Path(dirpath, filename)
+            file_keywords = _file_keywords(path)
+            if file_keywords is not None:
+                paths.append(path)
+                keyword_sets.append(file_keywords)
 
-    for path in sorted(root.rglob("*.md")):
-        try:
-            text = path.read_text(encoding="utf-8")
-        except OSError:
-            continue
-        name = path.stem.lower()
-        score = sum(1 for kw in keywords if kw in name or kw in text.lower())
-        if score > best_score:
-            best_path = path
-            best_score = score
-        if best_score and best_score >= len(keywords):
-            break
+    best_path: Path | None = None
+    if paths:
+        # argmax keeps the first file among equal scores, as the sorted scan did.
+        best_path = paths[int(_keyword_index(root, keyword_sets).score(keywords).argmax())]
 
     if best_path:
         try:
@@ -207,7 +365,7 @@ def _fallback_local_chunks(query: str, course_id: str | None) -> List[RetrievedC
             content = ""
         rel = best_path.relative_to(settings.data_dir)
         return [
-            RetrievedChunk(
+            RetrievedChunk.model_construct(
                 id=uuid4().hex,
                 text=content[:1000],
                 score=1.0,
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from .chat import Citation
+from .identifiers import check_identifier
 
 
 class FAQEntry(BaseModel):
@@ -34,7 +35,12 @@ class ReviewItem(BaseModel):
 class PromoteRequest(BaseModel):
     """Request payload for promoting a review item to the FAQ."""
 
-    queue_id: str = Field(..., max_length=64, pattern=r"^[a-zA-Z0-9_-]+$")
+    queue_id: str = Field(..., max_length=64)
     answer: Optional[str] = Field(default=None, max_length=10000)
     source_path: Optional[str] = Field(default=None, max_length=500)
-    course_id: str = Field(..., max_length=64, pattern=r"^[a-zA-Z0-9_-]+$")
+    course_id: str = Field(..., max_length=64)
+
+    @field_validator("queue_id", "course_id")
+    @classmethod
+    def validate_identifiers(cls, value: str) -> str:
+        return check_identifier(value)
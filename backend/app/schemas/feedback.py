@@ -1,37 +1,55 @@
 from __future__ import annotations
 
-from typing import List, Optional
-
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from .chat import Citation
+from .identifiers import check_identifier
+
+
+def _valid_email(email: str) -> bool:
+    """Cheap shape check: one '@' after a non-empty local part, then a dotted domain."""
+    at_idx = email.find("@")
+    return (
+        at_idx > 0
+        and email.find("@", at_idx + 1) == -1
+        and email.find(".", at_idx + 1) != -1
+        and not email.endswith(".")
+    )
 
 
 class FeedbackRequest(BaseModel):
     """Request payload for the /feedback endpoint."""
 
-    question_id: str = Field(..., max_length=64, pattern=r"^[a-zA-Z0-9_-]+$")
+    model_config = ConfigDict(defer_build=True)
+
+    question_id: str = Field(..., max_length=64)
     helpful: bool
-    comment: Optional[str] = Field(default=None, max_length=2000)
-    question: Optional[str] = Field(default=None, max_length=2000)
-    answer: Optional[str] = Field(default=None, max_length=10000)
-    citations: Optional[List[Citation]] = None
-    confidence: Optional[float] = Field(default=None, ge=0.0, le=1.0)
-    course_id: Optional[str] = Field(
+    comment: str | None = Field(default=None, max_length=2000)
+    question: str | None = Field(default=None, max_length=2000)
+    answer: str | None = Field(default=None, max_length=10000)
+    citations: list[Citation] | None = None
+    confidence: float | None = Field(default=None, ge=0.0, le=1.0)
+    course_id: str | None = Field(
         default=None,
         max_length=64,
-        pattern=r"^[a-zA-Z0-9_-]+$",
         description="Course identifier. Required.",
     )
 
     @field_validator("comment", "question", "answer", mode="before")
     @classmethod
-    def strip_strings(cls, value: Optional[str]) -> Optional[str]:
+    def strip_strings(cls, value: str | None) -> str | None:
         """Strip leading/trailing whitespace from string fields."""
         return value.strip() if isinstance(value, str) else value
 
+    @field_validator("question_id", "course_id")
+    @classmethod
+    def validate_identifiers(cls, value: str | None) -> str | None:
+        return check_identifier(value)
+
 
 class FeedbackResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     ok: bool
     review_enqueued: bool = False
 
@@ -39,22 +57,31 @@ class FeedbackResponse(BaseModel):
 class EscalationRequest(BaseModel):
     """Request payload for escalation to instructor."""
 
-    question_id: str = Field(..., max_length=64, pattern=r"^[a-zA-Z0-9_-]+$")
+    model_config = ConfigDict(defer_build=True)
+
+    question_id: str = Field(..., max_length=64)
     question: str = Field(..., min_length=1, max_length=2000)
     student_name: str = Field(..., min_length=1, max_length=200)
     student_email: str = Field(..., max_length=320)
-    confidence: Optional[float] = Field(default=None, ge=0.0, le=1.0)
-    escalation_reason: Optional[str] = Field(default=None, max_length=64)
-    course_id: str = Field(..., max_length=64, pattern=r"^[a-zA-Z0-9_-]+$")
+    confidence: float | None = Field(default=None, ge=0.0, le=1.0)
+    escalation_reason: str | None = Field(default=None, max_length=64)
+    course_id: str = Field(..., max_length=64)
 
     @field_validator("student_email")
     @classmethod
     def validate_student_email(cls, value: str) -> str:
         email = value.strip()
-        if "@" not in email or "." not in email.split("@")[-1]:
+        if not _valid_email(email):
             raise ValueError("student_email must be a valid email address")
         return email
 
+    @field_validator("question_id", "course_id")
+    @classmethod
+    def validate_identifiers(cls, value: str | None) -> str | None:
+        return check_identifier(value)
+
 
 class EscalationResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     ok: bool
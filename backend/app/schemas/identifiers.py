@@ -0,0 +1,14 @@
+"""Shared identifier validation for request schemas."""
+
+from __future__ import annotations
+
+import re
+
+ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+\Z")
+
+
+def check_identifier(value: str | None) -> str | None:
+    """Reject identifiers containing anything but letters, digits, '_' or '-'."""
+    if value is not None and not ID_PATTERN.match(value):
+        raise ValueError("must contain only letters, digits, '_' or '-'")
+    return value
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
-from typing import List, Optional
-
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class InsightsTotals(BaseModel):
     """Aggregate metrics for a course."""
 
+    model_config = ConfigDict(defer_build=True)
+
     questions: int = Field(..., description="Total questions asked.")
     helpful_rate: float = Field(..., ge=0.0, le=1.0, description="Proportion of helpful feedback.")
     average_confidence: float = Field(..., ge=0.0, le=1.0, description="Mean confidence score.")
@@ -15,37 +15,49 @@ class InsightsTotals(BaseModel):
 
 
 class TopQuestion(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     label: str
     count: int
 
 
 class DailyVolumePoint(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     date: str
     count: int
 
 
 class ConfidencePoint(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     date: str
     confidence: float
 
 
 class EscalationRow(BaseModel):
-    question: Optional[str]
-    student: Optional[str]
-    submitted_at: Optional[str]
+    model_config = ConfigDict(defer_build=True)
+
+    question: str | None
+    student: str | None
+    submitted_at: str | None
     delivered: bool
 
 
 class PainPoint(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     label: str
     change: float
 
 
 class InsightsResponse(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     totals: InsightsTotals
-    top_questions: List[TopQuestion]
-    daily_volume: List[DailyVolumePoint]
-    confidence_trend: List[ConfidencePoint]
-    escalations: List[EscalationRow]
-    pain_points: List[PainPoint]
+    top_questions: list[TopQuestion]
+    daily_volume: list[DailyVolumePoint]
+    confidence_trend: list[ConfidencePoint]
+    escalations: list[EscalationRow]
+    pain_points: list[PainPoint]
     last_updated: str
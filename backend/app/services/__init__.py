@@ -1,9 +1,10 @@
 """Shared storage and analytics helpers for the LENA backend."""
 
-from . import analytics, courses, demo_seed, escalations, exports, instructor_auth, questions, resources, review, storage
+from . import analytics, answer_cache, courses, demo_seed, escalations, exports, instructor_auth, questions, resources, review, storage
 
 __all__ = [
     "analytics",
+    "answer_cache",
     "courses",
     "demo_seed",
     "escalations",
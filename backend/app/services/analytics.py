@@ -1,20 +1,55 @@
 from __future__ import annotations
 
-from collections import Counter
+import atexit
+import heapq
+import threading
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Any
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Iterator
 
 from . import escalations as escalation_service
 from ..settings import settings
-from .storage import append_jsonl, read_json, read_jsonl, storage_path, write_json
+from .storage import append_jsonl_batch, iter_jsonl_from, read_json, storage_path, utc_timestamp, write_json
 
 SUMMARY_FILENAME = "analytics_summary.json"
+INTERACTIONS_FILENAME = "interactions.jsonl"
 DEFAULT_COURSE_KEY = "__default__"
+# The saved summary is {"version": SUMMARY_VERSION, "cursor": <byte offset of the
+# interaction log it reflects>, "courses": {course key: state}}. Older files kept
+# course states at the top level, next to an optional "__cursor__" entry.
+SUMMARY_VERSION = 2
+LEGACY_CURSOR_KEY = "__cursor__"
+
+# The summary and new interaction lines live in memory and are written back
+# at most every FLUSH_INTERVAL_SECONDS or FLUSH_EVERY_EVENTS events, and at exit.
+FLUSH_INTERVAL_SECONDS = 2.0
+FLUSH_EVERY_EVENTS = 50
+
+# Only the top questions are reported, so per-course question counts keep at
+# most this many candidates (Space-Saving: a new question evicts the rarest).
+QUESTION_SKETCH_SIZE = 64
+
+_summary_lock = threading.RLock()
+_summary_cache: dict[str, Any] | None = None
+_summary_cache_path: Path | None = None
+_synced_stamp: tuple[int, int] | None = None
+_pending_events: list[dict[str, Any]] = []
+_pending_path: Path | None = None
+_dirty_events = 0
+_flush_timer: threading.Timer | None = None
 
 
 @dataclass
 class InteractionEvent:
+    """Typed view of one interaction record.
+
+    Aggregation reads the raw dicts from the JSONL directly; this wrapper is
+    for callers that want attribute access.
+    """
+
     type: str
     question_id: str
     timestamp: str
@@ -41,8 +76,14 @@ def log_event(event: dict[str, Any]) -> None:
     # Truncate excessively long question text to prevent storage abuse
     if event.get("question") and len(str(event["question"])) > 2000:
         event = {**event, "question": str(event["question"])[:2000]}
-    append_jsonl(storage_path("interactions.jsonl"), event)
-    _apply_event_to_summary(event)
+    global _pending_path
+    with _summary_lock:
+        # Sync before buffering so a replay never counts this event twice.
+        summary = _current_summary()
+        _pending_path = storage_path(INTERACTIONS_FILENAME)
+        _pending_events.append(event)
+        _apply_event_to_summary(summary, event)
+        _mark_dirty()
 
 
 def _course_key(course_id: str | None) -> str:
@@ -60,15 +101,66 @@ def _empty_course_state() -> dict[str, Any]:
         "feedback_total": 0,
         "question_counts": {},
         "daily_volume": {},
-        "confidence_daily": {},
-        "feedback_by_question": {},
+        "confidence_daily_sum": {},
+        "confidence_daily_count": {},
+        "feedback_helpful": {},
+        "feedback_counts": {},
         "last_updated": None,
     }
 
 
+def _empty_summary(cursor: int | None = 0) -> dict[str, Any]:
+    """Return a summary with no course states, reflecting the log up to ``cursor``."""
+    return {"version": SUMMARY_VERSION, "cursor": cursor, "courses": {}}
+
+
 def _load_summary() -> dict[str, Any]:
-    """Load the analytics summary from storage."""
-    return read_json(storage_path(SUMMARY_FILENAME), default={})
+    """Load the analytics summary from storage, upgrading the flat legacy layout.
+
+    The cursor is None when the file predates it.
+    """
+    raw = read_json(storage_path(SUMMARY_FILENAME), default={})
+    if not isinstance(raw, dict):
+        raw = {}
+    if raw.get("version") == SUMMARY_VERSION and isinstance(raw.get("courses"), dict):
+        summary = raw
+        summary.setdefault("cursor", None)
+    else:
+        cursor = raw.pop(LEGACY_CURSOR_KEY, None)
+        summary = _empty_summary(cursor if isinstance(cursor, int) else None)
+        summary["courses"] = {key: state for key, state in raw.items() if isinstance(state, dict)}
+    for state in _course_states(summary):
+        _migrate_course_state(state)
+    return summary
+
+
+def _course_states(summary: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Iterate the per-course states of a summary."""
+    return iter(summary["courses"].values())
+
+
+def _migrate_course_state(state: dict[str, Any]) -> None:
+    """Bring a stored course state up to the current layout (flat maps, bounded question counts)."""
+    confidence_daily = state.pop("confidence_daily", None)
+    if confidence_daily is not None:
+        state["confidence_daily_sum"] = {day: b.get("sum", 0.0) for day, b in confidence_daily.items()}
+        state["confidence_daily_count"] = {day: b.get("count", 0) for day, b in confidence_daily.items()}
+    feedback_by_question = state.pop("feedback_by_question", None)
+    if feedback_by_question is not None:
+        state["feedback_helpful"] = {
+            question: stats["helpful"]
+            for question, stats in feedback_by_question.items()
+            if stats.get("helpful")
+        }
+        state["feedback_counts"] = {
+            question: stats.get("total", 0) for question, stats in feedback_by_question.items()
+        }
+    for key, value in _empty_course_state().items():
+        state.setdefault(key, value)
+    if len(state["question_counts"]) > QUESTION_SKETCH_SIZE:
+        state["question_counts"] = dict(
+            heapq.nlargest(QUESTION_SKETCH_SIZE, state["question_counts"].items(), key=itemgetter(1))
+        )
 
 
 def _save_summary(summary: dict[str, Any]) -> None:
@@ -76,82 +168,246 @@ def _save_summary(summary: dict[str, Any]) -> None:
     write_json(storage_path(SUMMARY_FILENAME), summary)
 
 
-def _apply_event_to_summary(event: dict[str, Any]) -> None:
-    """Update the analytics summary with a single event."""
-    summary = _load_summary()
-    key = _course_key(event.get("course_id"))
-    state = summary.setdefault(key, _empty_course_state())
-    event_ts = _parse_timestamp(event.get("timestamp")) or datetime.now(timezone.utc)
+def _apply_event_to_summary(summary: dict[str, Any], event: dict[str, Any], *, trim: bool = True) -> None:
+    """Update the in-memory analytics summary with a single event.
+
+    Replays pass ``trim=False`` and call ``_trim_summary`` once at the end.
+    """
+    event_get = event.get
+    key = _course_key(event_get("course_id"))
+    courses = summary["courses"]
+    state = courses.get(key)
+    if state is None:
+        state = courses[key] = _empty_course_state()
+    raw_ts = event_get("timestamp")
+    parsed_ts = _parse_timestamp(raw_ts)
+    event_ts = parsed_ts or datetime.now(timezone.utc)
     date_key = event_ts.date().isoformat()
+    event_type = event_get("type")
 
-    if event.get("type") == "ask":
+    question = event_get("question")
+    if event_type == "ask":
         state["questions"] += 1
-        confidence = event.get("confidence")
+        confidence = event_get("confidence")
         if isinstance(confidence, (int, float)):
-            state["confidence_sum"] += float(confidence)
+            confidence = float(confidence)
+            state["confidence_sum"] += confidence
             state["confidence_count"] += 1
-            day_bucket = state["confidence_daily"].setdefault(date_key, {"sum": 0.0, "count": 0})
-            day_bucket["sum"] += float(confidence)
-            day_bucket["count"] += 1
-        if event.get("question"):
-            counter = state["question_counts"]
-            counter[event["question"]] = counter.get(event["question"], 0) + 1
+            day_sums = state["confidence_daily_sum"]
+            day_counts = state["confidence_daily_count"]
+            day_sums[date_key] = day_sums.get(date_key, 0.0) + confidence
+            day_counts[date_key] = day_counts.get(date_key, 0) + 1
+        if question:
+            _count_question(state["question_counts"], question)
         daily = state["daily_volume"]
         daily[date_key] = daily.get(date_key, 0) + 1
-    elif event.get("type") == "feedback":
+    elif event_type == "feedback":
+        helpful = bool(event_get("helpful"))
         state["feedback_total"] += 1
-        if event.get("helpful"):
+        if helpful:
             state["helpful_total"] += 1
-        question = event.get("question")
         if question:
-            stats = state["feedback_by_question"].setdefault(question, {"helpful": 0, "total": 0})
-            stats["total"] += 1
-            if event.get("helpful"):
-                stats["helpful"] += 1
-
-    state["last_updated"] = event_ts.isoformat().replace("+00:00", "Z")
-    _trim_history(state["daily_volume"])
-    _trim_history(state["confidence_daily"])
-    _save_summary(summary)
+            totals = state["feedback_counts"]
+            totals[question] = totals.get(question, 0) + 1
+            if helpful:
+                helpful_counts = state["feedback_helpful"]
+                helpful_counts[question] = helpful_counts.get(question, 0) + 1
+
+    # Logged timestamps are already ISO 8601 with a Z suffix; only re-format the rest.
+    if parsed_ts is not None and raw_ts.endswith("Z"):
+        state["last_updated"] = raw_ts
+    else:
+        state["last_updated"] = event_ts.isoformat().replace("+00:00", "Z")
+    if trim:
+        _trim_history(state["daily_volume"])
+        _trim_history(state["confidence_daily_sum"])
+        _trim_history(state["confidence_daily_count"])
+
+
+def _count_question(counts: dict[str, int], question: str) -> None:
+    """Count a question in a bounded Space-Saving sketch."""
+    if question in counts:
+        counts[question] += 1
+    elif len(counts) < QUESTION_SKETCH_SIZE:
+        counts[question] = 1
+    else:
+        # The newcomer inherits the evicted count, which bounds its overestimate.
+        rarest = min(counts, key=counts.__getitem__)
+        counts[question] = counts.pop(rarest) + 1
+
+
+def _trim_summary(summary: dict[str, Any]) -> None:
+    """Drop expired per-day history from every course state."""
+    for state in _course_states(summary):
+        _trim_history(state["daily_volume"])
+        _trim_history(state["confidence_daily_sum"])
+        _trim_history(state["confidence_daily_count"])
+
+
+def _file_stamp(path: Path) -> tuple[int, int] | None:
+    """Return (size, mtime_ns) for a file, or None when it does not exist."""
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _mark_dirty() -> None:
+    """Count an unsaved change and schedule a flush (caller holds the lock)."""
+    global _dirty_events, _flush_timer
+    _dirty_events += 1
+    if _dirty_events >= FLUSH_EVERY_EVENTS:
+        _flush_locked()
+    elif _flush_timer is None:
+        _flush_timer = threading.Timer(FLUSH_INTERVAL_SECONDS, flush_summary)
+        _flush_timer.daemon = True
+        _flush_timer.start()
+
+
+def _write_pending_locked() -> None:
+    """Append buffered interaction events to the log in one write (caller holds the lock)."""
+    global _pending_events, _synced_stamp
+    if not _pending_events or _pending_path is None or _summary_cache is None:
+        return
+    written = append_jsonl_batch(_pending_path, _pending_events)
+    _pending_events = []
+    if written is None:
+        return
+    start, end = written
+    summary = _summary_cache
+    if start != summary["cursor"]:
+        # Other writers appended since the last sync; fold in their lines, not ours.
+        _catch_up_locked(summary, _pending_path, end=start)
+    if summary["cursor"] == start:
+        summary["cursor"] = end
+    # Lines appended after ours are picked up by the next catch-up.
+    stamp = _file_stamp(_pending_path)
+    _synced_stamp = stamp if stamp is not None and stamp[0] == summary["cursor"] else None
+
+
+def _catch_up_locked(summary: dict[str, Any], path: Path, end: int | None = None) -> None:
+    """Apply log lines past the summary's cursor, up to ``end`` (caller holds the lock).
+
+    The log is append-only, so only new bytes are read. A log shorter than the
+    cursor was truncated or replaced, and is replayed from the start.
+    """
+    global _synced_stamp
+    stamp = _file_stamp(path)
+    offset = summary["cursor"] or 0
+    if (stamp[0] if stamp else 0) < offset:
+        summary["courses"].clear()
+        offset, end = 0, None
+    for offset, event in iter_jsonl_from(path, offset, end):
+        if event is not None:
+            _apply_event_to_summary(summary, event, trim=False)
+    _trim_summary(summary)
+    summary["cursor"] = offset
+    _synced_stamp = stamp
+
+
+def _flush_locked() -> None:
+    global _dirty_events, _flush_timer
+    if _flush_timer is not None:
+        _flush_timer.cancel()
+        _flush_timer = None
+    _write_pending_locked()
+    if _dirty_events and _summary_cache is not None and _summary_cache_path is not None:
+        write_json(_summary_cache_path, _summary_cache)
+    _dirty_events = 0
+
+
+def flush_summary() -> None:
+    """Write buffered interaction events and any unsaved summary changes to storage."""
+    with _summary_lock:
+        _flush_locked()
+
+
+atexit.register(flush_summary)
 
 
 def _trim_history(mapping: dict[str, Any], max_days: int | None = None) -> None:
     """Remove entries older than max_days from a date-keyed mapping."""
     if max_days is None:
         max_days = settings.analytics_history_days
-    cutoff = datetime.now(timezone.utc).date() - timedelta(days=max_days)
-    drop_keys = []
-    for key in mapping.keys():
-        try:
-            key_date = datetime.fromisoformat(key).date()
-        except ValueError:
-            continue
-        if key_date < cutoff:
-            drop_keys.append(key)
+    if not mapping:
+        return
+    cutoff = _history_cutoff(datetime.now(timezone.utc).date(), max_days)
+    # ISO dates order as strings; keys that are not YYYY-MM-DD are left alone.
+    drop_keys = [key for key in mapping if key < cutoff and len(key) == 10 and key[4] == "-"]
     for key in drop_keys:
-        mapping.pop(key, None)
+        del mapping[key]
+
+
+@lru_cache(maxsize=4)
+def _history_cutoff(today: date, max_days: int) -> str:
+    """Return the ISO date before which history is dropped (recomputed once per day)."""
+    return (today - timedelta(days=max_days)).isoformat()
 
 
-def _ensure_summary_synced() -> None:
-    """Rebuild the summary from interaction logs if out of date."""
-    interactions_path = storage_path("interactions.jsonl")
+@lru_cache(maxsize=2)
+def _recent_days(today: date, days: int = 30) -> tuple[str, ...]:
+    """Return the ISO dates of the last ``days`` days ending today, oldest first."""
+    return tuple((today - timedelta(days=offset)).isoformat() for offset in reversed(range(days)))
+
+
+def _current_summary() -> dict[str, Any]:
+    """Return the cached summary, catching up on interaction log lines it has not seen.
+
+    The summary records the byte offset of the log it reflects, so lines from
+    other writers (or a summary file saved before its last events) are applied
+    incrementally; the JSONL stays the source of truth. Summaries saved before
+    the cursor existed are trusted when at least as new as the log, and rebuilt
+    otherwise. Caller holds ``_summary_lock``.
+    """
+    global _summary_cache, _summary_cache_path
     summary_path = storage_path(SUMMARY_FILENAME)
-    if not interactions_path.exists():
-        if not summary_path.exists():
-            _save_summary({})
-        return
-    if not summary_path.exists() or summary_path.stat().st_mtime < interactions_path.stat().st_mtime:
-        _save_summary({})
-        for event in read_jsonl(interactions_path):
-            _apply_event_to_summary(event)
+    interactions_path = storage_path(INTERACTIONS_FILENAME)
+    stamp = _file_stamp(interactions_path)
+    if _summary_cache is not None and _summary_cache_path == summary_path:
+        if stamp != _synced_stamp:
+            _catch_up_locked(_summary_cache, interactions_path)
+            _mark_dirty()
+        return _summary_cache
+
+    if _summary_cache is not None:
+        # Switching storage directories: settle the previous one first.
+        _flush_locked()
+    summary_stamp = _file_stamp(summary_path)
+    summary = _load_summary()
+    if summary["cursor"] is None:
+        if stamp is None or (summary_stamp is not None and summary_stamp[1] >= stamp[1]):
+            summary["cursor"] = stamp[0] if stamp else 0
+        else:
+            summary = _empty_summary()
+    _catch_up_locked(summary, interactions_path)
+    _save_summary(summary)
+
+    _summary_cache, _summary_cache_path = summary, summary_path
+    return summary
 
 
 def summarize(course_id: str | None = None) -> dict[str, Any]:
-    _ensure_summary_synced()
-    summary = _load_summary()
-    key = _course_key(course_id)
-    state = summary.get(key, _empty_course_state())
+    with _summary_lock:
+        courses = _current_summary()["courses"]
+        insights = _summarize_state(courses.get(_course_key(course_id), _empty_course_state()))
 
+    escalation_rows = escalation_service.list_requests(course_id)
+    insights["totals"]["escalations"] = len(escalation_rows)
+    insights["escalations"] = [
+        {
+            "question": entry.get("question"),
+            "student": entry.get("student"),
+            "submitted_at": entry.get("submitted_at"),
+            "delivered": bool(entry.get("delivered", False)),
+        }
+        for entry in escalation_rows
+    ]
+    return insights
+
+
+def _summarize_state(state: dict[str, Any]) -> dict[str, Any]:
+    """Build the insights payload for one course state (escalations filled in by the caller)."""
     total_questions = state["questions"]
     avg_confidence = (
         state["confidence_sum"] / state["confidence_count"] if state["confidence_count"] else 0.0
@@ -160,63 +416,47 @@ def summarize(course_id: str | None = None) -> dict[str, Any]:
     feedback_total = state["feedback_total"]
     helpful_rate = helpful_total / feedback_total if feedback_total else 0.0
 
-    question_counter = Counter(state["question_counts"])
     top_questions = [
         {"label": label, "count": count}
-        for label, count in question_counter.most_common(5)
+        for label, count in heapq.nlargest(5, state["question_counts"].items(), key=itemgetter(1))
     ]
 
-    last_30_days = [
-        (datetime.now(timezone.utc).date() - timedelta(days=offset)).isoformat()
-        for offset in reversed(range(30))
-    ]
-    daily_volume = [
-        {"date": day, "count": state["daily_volume"].get(day, 0)}
-        for day in last_30_days
-    ]
+    last_30_days = _recent_days(datetime.now(timezone.utc).date())
+    volume_get = state["daily_volume"].get
+    daily_volume = [{"date": day, "count": volume_get(day, 0)} for day in last_30_days]
+    day_sums = state["confidence_daily_sum"]
+    day_counts_get = state["confidence_daily_count"].get
     confidence_trend = []
+    append_point = confidence_trend.append
     for day in last_30_days:
-        bucket = state["confidence_daily"].get(day)
-        if bucket and bucket.get("count"):
-            confidence_trend.append(
-                {"date": day, "confidence": round(bucket["sum"] / bucket["count"], 2)}
-            )
-        else:
-            confidence_trend.append({"date": day, "confidence": 0.0})
-
-    pain_points = []
-    for question, stats in state["feedback_by_question"].items():
-        total = stats.get("total", 0)
-        if not total:
-            continue
-        helpful_share = stats.get("helpful", 0) / total
-        change = round(0.5 - helpful_share, 2)
-        pain_points.append({"label": question, "change": change})
-    pain_points.sort(key=lambda entry: entry["change"], reverse=True)
-    pain_points = pain_points[:10]
+        count = day_counts_get(day, 0)
+        append_point({"date": day, "confidence": round(day_sums[day] / count, 2) if count else 0.0})
+
+    helpful_get = state["feedback_helpful"].get
+    pain_candidates = (
+        (question, round(0.5 - helpful_get(question, 0) / total, 2))
+        for question, total in state["feedback_counts"].items()
+        if total
+    )
+    # Only the selected rows become dicts.
+    pain_points = [
+        {"label": question, "change": change}
+        for question, change in heapq.nlargest(10, pain_candidates, key=itemgetter(1))
+    ]
 
-    escalation_rows = escalation_service.list_requests(course_id)
-    last_updated = state["last_updated"] or datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    last_updated = state["last_updated"] or utc_timestamp()
 
     return {
         "totals": {
             "questions": total_questions,
             "helpful_rate": round(helpful_rate, 2),
             "average_confidence": round(avg_confidence, 2),
-            "escalations": len(escalation_rows),
+            "escalations": 0,
         },
         "top_questions": top_questions,
         "daily_volume": daily_volume,
         "confidence_trend": confidence_trend,
-        "escalations": [
-            {
-                "question": entry.get("question"),
-                "student": entry.get("student"),
-                "submitted_at": entry.get("submitted_at"),
-                "delivered": bool(entry.get("delivered", False)),
-            }
-            for entry in escalation_rows
-        ],
+        "escalations": [],
         "pain_points": pain_points,
         "last_updated": last_updated,
     }
@@ -0,0 +1,99 @@
+"""In-process cache of `/ask` answers (exact match first, then semantic match).
+
+Course Q&A sees many repeated or near-identical questions. Caching the
+answer, citations, and confidence per course lets those skip retrieval and
+generation entirely. Entries are invalidated whenever course content changes.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from ..settings import settings
+
+MAX_ENTRIES = 1024
+
+_lock = threading.Lock()
+_entries: "OrderedDict[tuple[str, str], dict[str, Any]]" = OrderedDict()
+_vectors: dict[tuple[str, str], np.ndarray] = {}
+
+
+def normalize_question(question: str) -> str:
+    """Return the cache key form of a question (case- and whitespace-insensitive)."""
+    return " ".join(question.lower().split())
+
+
+def _embed(question: str) -> np.ndarray:
+    """Embed a question as a unit vector.
+
+    Goes through retrieval's memoized query encoder, so a cache miss that
+    falls through to ``retrieve`` reuses this vector instead of encoding again.
+    """
+    from ..rag.retrieve import embed_query  # local import to avoid circular dependency
+
+    vector = np.asarray(embed_query(question), dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm else vector
+
+
+def lookup(course_id: str, question: str) -> dict[str, Any] | None:
+    """Return a cached answer for the question within a course, if any."""
+    normalized = normalize_question(question)
+    key = (course_id, normalized)
+    with _lock:
+        hit = _entries.get(key)
+        if hit is not None:
+            _entries.move_to_end(key)
+            return hit
+        candidates = [(k, v) for k, v in _vectors.items() if k[0] == course_id]
+
+    threshold = settings.answer_cache_similarity
+    if not candidates or threshold >= 1.0:
+        return None
+
+    query = _embed(question)
+    matrix = np.stack([vector for _, vector in candidates])
+    if matrix.shape[1] != query.shape[0]:
+        return None
+    scores = matrix @ query
+    best = int(np.argmax(scores))
+    if scores[best] < threshold:
+        return None
+
+    best_key = candidates[best][0]
+    with _lock:
+        hit = _entries.get(best_key)
+        if hit is not None:
+            _entries.move_to_end(best_key)
+        return hit
+
+
+def store(course_id: str, question: str, response: dict[str, Any]) -> None:
+    """Cache an answer payload (answer, citations, confidence) for a course question."""
+    normalized = normalize_question(question)
+    key = (course_id, normalized)
+    vector = _embed(question) if settings.answer_cache_similarity < 1.0 else None
+    with _lock:
+        _entries[key] = response
+        _entries.move_to_end(key)
+        if vector is not None:
+            _vectors[key] = vector
+        while len(_entries) > MAX_ENTRIES:
+            evicted, _ = _entries.popitem(last=False)
+            _vectors.pop(evicted, None)
+
+
+def clear(course_id: str | None = None) -> None:
+    """Drop cached answers for one course, or for every course when omitted."""
+    with _lock:
+        if course_id is None:
+            _entries.clear()
+            _vectors.clear()
+            return
+        for key in [k for k in _entries if k[0] == course_id]:
+            _entries.pop(key, None)
+            _vectors.pop(key, None)
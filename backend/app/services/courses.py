@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Any
 
 from .storage import read_json, storage_path
@@ -27,6 +28,16 @@ DEFAULT_COURSES: list[dict[str, str]] = [
     },
 ]
 
+# Parsed catalog keyed by the courses.json stat stamp, plus an id -> course index.
+_catalog_cache: (
+    tuple[
+        tuple[Path, int, int, int],
+        list[dict[str, str | None]],
+        dict[str, dict[str, str | None]],
+    ]
+    | None
+) = None
+
 
 def _coerce_courses(payload: Any) -> list[dict[str, str | None]]:
     """Validate and normalize course data from storage."""
@@ -47,20 +58,40 @@ def _coerce_courses(payload: Any) -> list[dict[str, str | None]]:
     return sanitized
 
 
+def _catalog() -> tuple[list[dict[str, str | None]], dict[str, dict[str, str | None]]]:
+    """Return the parsed catalog and its id index, re-reading only when the file changes."""
+    global _catalog_cache
+    path = storage_path("courses.json")
+    try:
+        stat = path.stat()
+        stamp = (path, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stamp = (path, 0, 0, 0)
+    cached = _catalog_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+
+    catalog = _coerce_courses(read_json(path, default=DEFAULT_COURSES))
+    # Iterate in reverse so the first entry wins when IDs repeat.
+    by_id = {course["id"]: course for course in reversed(catalog)}
+    _catalog_cache = (stamp, catalog, by_id)
+    return catalog, by_id
+
+
 def load_courses() -> list[dict[str, str | None]]:
     """Load the list of courses from storage, seeding defaults when empty."""
-    data = read_json(storage_path("courses.json"), default=DEFAULT_COURSES)
-    return _coerce_courses(data)
+    catalog, _ = _catalog()
+    return list(catalog)
 
 
 def get_course(course_id: str | None) -> dict[str, str | None] | None:
     """Look up a course by ID."""
     if not course_id:
         return None
-    return next((c for c in load_courses() if c["id"] == course_id), None)
+    return _catalog()[1].get(course_id)
 
 
 def get_default_course() -> dict[str, str | None] | None:
     """Return the first configured course as the default."""
-    courses = load_courses()
-    return courses[0] if courses else None
+    catalog, _ = _catalog()
+    return catalog[0] if catalog else None
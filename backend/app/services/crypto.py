@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import base64
-import hashlib
 import logging
 import os
 from functools import lru_cache
@@ -11,21 +9,80 @@ from typing import Optional
 
 from cryptography.fernet import Fernet, InvalidToken
 
+try:
+    import rfernet  # type: ignore
+except ImportError:  # pragma: no cover - optional Rust backend
+    rfernet = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 # Environment variable for encryption key
 _ENCRYPTION_KEY_ENV = "LENA_ENCRYPTION_KEY"
+# Opt-in switch for the Rust Fernet backend (same token format).
+_USE_RFERNET_ENV = "LENA_USE_RFERNET"
+# OpenSSL capability mask; a value set here can hide AES-NI from EVP.
+_OPENSSL_IA32CAP_ENV = "OPENSSL_ia32cap"
+
+
+class _RustFernet:
+    """Adapter giving ``rfernet.Fernet`` the bytes-in/bytes-out API of ``cryptography``."""
+
+    def __init__(self, key: str):
+        self._fernet = rfernet.Fernet(key)
+
+    def encrypt(self, data: bytes) -> bytes:
+        return self._fernet.encrypt(data).encode("ascii")
+
+    def decrypt(self, token: bytes) -> bytes:
+        try:
+            return self._fernet.decrypt(token.decode("ascii"))
+        except (rfernet.DecryptionError, UnicodeDecodeError) as exc:
+            raise InvalidToken from exc
+
+
+def _cpu_has_aes() -> Optional[bool]:
+    """Return whether /proc/cpuinfo advertises AES instructions (None when unknown)."""
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith("flags"):
+                    return "aes" in line.split(":", 1)[-1].split()
+    except OSError:
+        return None
+    return None
+
+
+def _log_crypto_backend() -> None:
+    """Log the OpenSSL build behind Fernet and warn when AES-NI is likely unused."""
+    try:
+        from cryptography.hazmat.backends.openssl.backend import backend
+
+        logger.info("Fernet backend: %s", backend.openssl_version_text())
+    except Exception:  # pragma: no cover - diagnostic only
+        pass
+    if _cpu_has_aes() is False:
+        logger.warning("CPU does not advertise AES-NI; Fernet will use software AES")
+    if os.getenv(_OPENSSL_IA32CAP_ENV):
+        logger.warning(
+            "%s is set; it can disable AES-NI in OpenSSL and slow PII encryption",
+            _OPENSSL_IA32CAP_ENV,
+        )
 
 
 @lru_cache(maxsize=1)
-def _get_fernet() -> Optional[Fernet]:
+def _get_fernet() -> Optional[Fernet | _RustFernet]:
     """Return a Fernet instance when configured, otherwise None."""
     key = os.getenv(_ENCRYPTION_KEY_ENV)
     if not key:
         return None
+    _log_crypto_backend()
 
     # Ensure key is valid Fernet key (32 url-safe base64-encoded bytes)
     try:
+        if os.getenv(_USE_RFERNET_ENV) == "1":
+            if rfernet is not None:
+                return _RustFernet(key)
+            logger.warning("%s=1 but rfernet is not installed; using cryptography", _USE_RFERNET_ENV)
         return Fernet(key.encode())
     except Exception as exc:
         logger.error("Invalid encryption key format: %s", exc)
@@ -45,13 +102,35 @@ def encrypt_pii(plaintext: str) -> str:
     return f"ENC:{encrypted.decode('utf-8')}"
 
 
+def encrypt_pii_many(values: list[str]) -> list[str]:
+    """Encrypt several PII values with one Fernet lookup; require encryption to be configured."""
+    fernet = _get_fernet()
+    if fernet is None:
+        raise RuntimeError(
+            f"{_ENCRYPTION_KEY_ENV} is not set; refuse to store PII unencrypted. "
+            "Generate a key: python -c \"from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())\""
+        )
+
+    encrypt = fernet.encrypt
+    return [f"ENC:{encrypt(value.encode('utf-8')).decode('utf-8')}" for value in values]
+
+
 def decrypt_pii(ciphertext: str) -> str:
     """Decrypt a stored PII value, supporting legacy plaintext values."""
     # Handle unencrypted legacy data
     if not ciphertext.startswith("ENC:"):
         return ciphertext
+    return _decrypt_token(_get_fernet(), ciphertext)
 
+
+def decrypt_pii_many(values: list[str]) -> list[str]:
+    """Decrypt several stored PII values with one Fernet lookup."""
     fernet = _get_fernet()
+    return [_decrypt_token(fernet, value) if value.startswith("ENC:") else value for value in values]
+
+
+def _decrypt_token(fernet: Optional[Fernet | _RustFernet], ciphertext: str) -> str:
+    """Decrypt one ``ENC:``-prefixed value, mapping failures to placeholder strings."""
     if fernet is None:
         logger.warning("Cannot decrypt - encryption key not configured")
         return "[ENCRYPTED - KEY NOT AVAILABLE]"
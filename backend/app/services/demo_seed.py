@@ -8,91 +8,111 @@ export users can see the data structure immediately.
 
 from __future__ import annotations
 
+from collections import Counter, defaultdict
 from datetime import datetime, timedelta, timezone
-import json
+from functools import lru_cache
 from pathlib import Path
 from itertools import cycle
 
 from ..settings import settings
 from . import courses, escalations, questions, review
-from .analytics import log_event
-from .storage import read_json, storage_path, utc_timestamp, write_json
+from .analytics import flush_summary, log_event
+from .storage import iter_jsonl, read_json, storage_path, utc_timestamp, write_json
+
+# Status mix cycled through when seeding demo escalations.
+_STATUS_PATTERN = ("new",) * 5 + ("contacted",) * 4 + ("in_process",) * 3 + ("resolved",) * 3
+# Seeded statuses that imply the student was reached, and those still awaiting follow-up.
+_DELIVERED_STATUSES = frozenset({"contacted", "in_process", "resolved"})
+_FOLLOW_UP_STATUSES = frozenset({"contacted", "in_process"})
 
 
 def _file_has_content(name: str) -> bool:
-    path = storage_path(name)
-    if not path.exists():
-        return False
     try:
-        return path.stat().st_size > 0
+        return storage_path(name).stat().st_size > 0
     except OSError:
         return False
 
 
 def _already_seeded() -> dict:
-    marker = storage_path("demo_seed.json")
-    if not marker.exists():
-        return {}
+    return _read_marker(str(storage_path("demo_seed.json")))
+
+
+@lru_cache(maxsize=4)
+def _read_marker(marker_path: str) -> dict:
+    """Parse the seed marker once per path; cleared whenever maybe_seed rewrites it."""
     try:
-        payload = read_json(marker, default={})
+        payload = read_json(Path(marker_path), default={})
         return payload if isinstance(payload, dict) else {}
     except Exception:
         return {}
 
 
+def _mtime_ns(name: str) -> int:
+    try:
+        return storage_path(name).stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def _seed_complete() -> bool:
+    """Return True when the marker covers an unchanged catalog and all seeded data is present."""
+    marker = _already_seeded()
+    seeded_courses = marker.get("courses")
+    if not marker.get("seeded") or not isinstance(seeded_courses, list):
+        return False
+    # A catalog edited after seeding may add courses that still need data.
+    if _mtime_ns("courses.json") > _mtime_ns("demo_seed.json"):
+        return False
+    if not storage_path("faq.json").exists() or not _file_has_content("interactions.jsonl"):
+        return False
+    escalation_counts = _count_escalations_by_course()
+    return all(escalation_counts.get(str(cid or "demo"), 0) >= 15 for cid in seeded_courses)
+
+
 def _demo_escalation_count() -> int:
     try:
-        entries = escalations.list_requests()
+        entries = escalations.iter_requests()
     except Exception:
         return 0
     return sum(1 for e in entries if "demo_escalation" in str(e.get("question_id") or ""))
 
 
 def _count_escalations_by_course() -> dict[str, int]:
-    counts: dict[str, int] = {}
     try:
-        entries = escalations.list_requests()
+        return escalations.count_requests_by_course()
     except Exception:
-        return counts
-    for e in entries:
-        cid = str(e.get("course_id") or "")
-        counts[cid] = counts.get(cid, 0) + 1
-    return counts
+        return {}
 
 
+@lru_cache(maxsize=None)
 def _load_demo_file(course_id: str) -> dict:
+    """Parse a course's demo file; cached for one maybe_seed run, which clears it."""
     path = Path("data/demo") / f"{course_id}.json"
-    if not path.exists():
-        return {}
-    try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except Exception:
-        return {}
+    payload = read_json(path, default={})
+    return payload if isinstance(payload, dict) else {}
 
 
-def _existing_interaction_ids(course_id: str) -> set[str]:
-    path = storage_path("interactions.jsonl")
-    ids: set[str] = set()
-    if not path.exists():
-        return ids
+def _existing_interaction_ids_by_course() -> dict[str, set[str]]:
+    """Return logged question ids per course from one streaming pass over interactions.jsonl."""
+    flush_summary()
+    ids: defaultdict[str, set[str]] = defaultdict(set)
     try:
-        for line in path.read_text(encoding="utf-8").splitlines():
-            try:
-                obj = json.loads(line)
-            except Exception:
-                continue
-            if str(obj.get("course_id") or "") == course_id and obj.get("question_id"):
-                ids.add(str(obj["question_id"]))
+        for obj in iter_jsonl(storage_path("interactions.jsonl")):
+            qid = obj.get("question_id")
+            if qid:
+                ids[str(obj.get("course_id") or "")].add(str(qid))
     except Exception:
-        return ids
+        pass
     return ids
 
 
-def _ensure_faq(course_list: list[dict[str, str | None]], target_per_course: int = 15) -> None:
-    """Ensure each course has a minimum number of FAQ entries for the demo."""
-    faq_path = storage_path("faq.json")
-    existing = read_json(faq_path, default=[])
-    entries = existing if isinstance(existing, list) else []
+def _ensure_faq(
+    entries: list,
+    keyset: set[tuple[str, str]],
+    course_list: list[dict[str, str | None]],
+    target_per_course: int = 15,
+) -> None:
+    """Top up ``entries`` (and its ``keyset``) in place so each course has a minimum number of FAQ entries."""
     now = utc_timestamp()
 
     base_questions = [
@@ -113,16 +133,10 @@ def _ensure_faq(course_list: list[dict[str, str | None]], target_per_course: int
         ("How do I prepare for the exam?", "Review lecture summaries, key terms, and practice questions provided in the study guide.", "exams.md"),
     ]
 
-    keyset = {
-        (str(e.get("course_id") or ""), str(e.get("question") or ""))
-        for e in entries
-        if isinstance(e, dict)
-    }
-
-    added = 0
+    counts = Counter(str(e.get("course_id") or "") for e in entries if isinstance(e, dict))
     for course in course_list:
         cid = str(course.get("id") or "demo")
-        current = sum(1 for e in entries if isinstance(e, dict) and str(e.get("course_id") or "") == cid)
+        current = counts[cid]
         if current >= target_per_course:
             continue
         needed = target_per_course - current
@@ -143,32 +157,45 @@ def _ensure_faq(course_list: list[dict[str, str | None]], target_per_course: int
                 }
             )
             keyset.add(key)
-            added += 1
             needed -= 1
 
-    write_json(faq_path, entries)
-    if added:
-        pass  # silent; demo helper
-
 
 def maybe_seed() -> None:
     """Seed demo logs if enabled and storage is empty."""
     if not getattr(settings, "demo_seed_data", False):
         return
 
-    seeded_marker = _already_seeded()
+    # Fast path for restarts: nothing to top up, so skip even the catalog load.
+    if _seed_complete():
+        return
 
-    now = datetime.now(timezone.utc)
     course_list = courses.load_courses()
     if not course_list:
         return
 
+    now = datetime.now(timezone.utc)
+
+    # FAQ entries are merged in memory and written once at the end.
+    faq_path = storage_path("faq.json")
+    existing_faq = read_json(faq_path, default=[])
+    faq_entries = existing_faq if isinstance(existing_faq, list) else []
+    loaded_faq_count = len(faq_entries)
+    faq_keyset = {
+        (str(e.get("course_id") or ""), str(e.get("question") or ""))
+        for e in faq_entries
+        if isinstance(e, dict)
+    }
+
     # Ensure FAQs are present and reasonably dense for each course
-    _ensure_faq(course_list, target_per_course=15)
+    _ensure_faq(faq_entries, faq_keyset, course_list, target_per_course=15)
 
+    # Only ~15 distinct day offsets occur across all courses, so format each once.
+    @lru_cache(maxsize=None)
     def ts(days_ago: int) -> str:
         return (now - timedelta(days=days_ago)).isoformat().replace("+00:00", "Z")
 
+    interaction_ids = _existing_interaction_ids_by_course()
+
     # Seed Q&A, feedback, and FAQs using external demo files (per course) to simplify removal in prod.
     for idx, course in enumerate(course_list, start=1):
         course_id = str(course.get("id") or f"course{idx}")
@@ -177,20 +204,15 @@ def maybe_seed() -> None:
         # FAQs from file (fallback to ensure minimum)
         faqs = data.get("faqs") or []
         if faqs:
-            faq_path = storage_path("faq.json")
-            existing = read_json(faq_path, default=[])
-            entries = existing if isinstance(existing, list) else []
-            keyset = {(str(e.get("course_id") or ""), str(e.get("question") or "")) for e in entries if isinstance(e, dict)}
-            added = 0
             now_iso = utc_timestamp()
             for entry in faqs:
                 q = str(entry.get("question") or "").strip()
                 if not q:
                     continue
                 key = (course_id, q)
-                if key in keyset:
+                if key in faq_keyset:
                     continue
-                entries.append(
+                faq_entries.append(
                     {
                         "question": q,
                         "answer": entry.get("answer") or "Demo answer pending.",
@@ -199,15 +221,13 @@ def maybe_seed() -> None:
                         "course_id": course_id,
                     }
                 )
-                keyset.add(key)
-                added += 1
-            if added:
-                write_json(faq_path, entries)
+                faq_keyset.add(key)
 
         # Interactions (ask + feedback) across 14 weeks
         interactions = data.get("interactions") or []
         if interactions:
-            existing_ids = _existing_interaction_ids(course_id)
+            existing_ids = interaction_ids[course_id]
+            answers: list[dict] = []
             for idx_int, item in enumerate(interactions, start=1):
                 week = int(item.get("week") or idx_int)
                 days_ago = max(0, (14 - week) * 7 + 1)
@@ -229,7 +249,7 @@ def maybe_seed() -> None:
                         "timestamp": ts_label,
                     }
                 )
-                questions.record_answer(
+                answers.append(
                     {
                         "question_id": qid,
                         "course_id": course_id,
@@ -258,6 +278,7 @@ def maybe_seed() -> None:
                         "timestamp": ts(max(days_ago - 1, 0)),
                     }
                 )
+            questions.record_answers(answers)
 
             # Seed a review queue item (mirrors not-helpful feedback).
             review.append_review_item(
@@ -282,9 +303,9 @@ def maybe_seed() -> None:
     try:
         existing_counts = _count_escalations_by_course()
         target_per_course = 15
-        status_cycle = cycle(
-            ["new"] * 5 + ["contacted"] * 4 + ["in_process"] * 3 + ["resolved"] * 3
-        )
+        status_cycle = cycle(_STATUS_PATTERN)
+        # Collected up front so all PII is encrypted and appended in one batch.
+        pending_requests: list[dict] = []
         for course in course_list:
             cid = str(course.get("id") or "demo")
             current = existing_counts.get(cid, 0)
@@ -298,7 +319,7 @@ def maybe_seed() -> None:
                 status = esc.get("status") or next(status_cycle)
                 week = int(esc.get("week") or idx)
                 submitted_at = ts(max(0, (14 - week) * 7 + 2))
-                escalations.append_request(
+                pending_requests.append(
                     {
                         "question_id": esc.get("question_id") or f"{cid}_demo_escalation_{current + idx}",
                         "question": esc.get("question") or f"Demo escalation #{current + idx} for {cid}",
@@ -307,14 +328,14 @@ def maybe_seed() -> None:
                         "course_id": cid,
                         "submitted_at": submitted_at,
                         "status": status,
-                        "notes": esc.get("notes") or ("Awaiting follow-up" if status in ("contacted", "in_process") else ""),
-                        "delivered": status in ("contacted", "in_process", "resolved"),
+                        "notes": esc.get("notes") or ("Awaiting follow-up" if status in _FOLLOW_UP_STATUSES else ""),
+                        "delivered": status in _DELIVERED_STATUSES,
                     }
                 )
 
             for idx in range(current + 1, target_per_course + 1):
                 status = next(status_cycle)
-                escalations.append_request(
+                pending_requests.append(
                     {
                         "question_id": f"{cid}_demo_escalation_{idx}",
                         "question": f"Demo escalation #{idx} for {cid}: I have a question about assignment {idx}.",
@@ -323,48 +344,33 @@ def maybe_seed() -> None:
                         "course_id": cid,
                         "submitted_at": utc_timestamp(),
                         "status": status,
-                        "notes": "Awaiting follow-up" if status in ("contacted", "in_process") else "",
-                        "delivered": status in ("contacted", "in_process", "resolved"),
+                        "notes": "Awaiting follow-up" if status in _FOLLOW_UP_STATUSES else "",
+                        "delivered": status in _DELIVERED_STATUSES,
                     }
                 )
+        escalations.append_requests(pending_requests)
     except RuntimeError:
         # Encryption key missing; skip seeding escalations to avoid plaintext PII.
         pass
 
     # Seed a tiny FAQ so the FAQ page shows structure immediately.
-    faq_path = storage_path("faq.json")
-    if not faq_path.exists():
+    if not faq_entries:
         demo_course = str(course_list[0].get("id") or "demo")
-        write_json(
-            faq_path,
-            [
-                {
-                    "question": "Where do I submit assignments? (demo seed)",
-                    "answer": "Demo answer: Submit assignments via the LMS link provided in the syllabus.",
-                    "source_path": f"{demo_course}/syllabus.md",
-                    "updated_at": utc_timestamp(),
-                    "course_id": demo_course,
-                }
-            ],
+        faq_entries.append(
+            {
+                "question": "Where do I submit assignments? (demo seed)",
+                "answer": "Demo answer: Submit assignments via the LMS link provided in the syllabus.",
+                "source_path": f"{demo_course}/syllabus.md",
+                "updated_at": utc_timestamp(),
+                "course_id": demo_course,
+            }
         )
-    else:
-        existing = read_json(faq_path, default=[])
-        if isinstance(existing, list) and not existing:
-            demo_course = str(course_list[0].get("id") or "demo")
-            write_json(
-                faq_path,
-                [
-                    {
-                        "question": "Where do I submit assignments? (demo seed)",
-                        "answer": "Demo answer: Submit assignments via the LMS link provided in the syllabus.",
-                        "source_path": f"{demo_course}/syllabus.md",
-                        "updated_at": utc_timestamp(),
-                        "course_id": demo_course,
-                    }
-                ],
-            )
+    if len(faq_entries) != loaded_faq_count:
+        write_json(faq_path, faq_entries)
 
     write_json(
         storage_path("demo_seed.json"),
         {"seeded": True, "seeded_at": utc_timestamp(), "courses": [c.get("id") for c in course_list]},
     )
+    _read_marker.cache_clear()
+    _load_demo_file.cache_clear()
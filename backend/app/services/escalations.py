@@ -4,17 +4,17 @@ from __future__ import annotations
 
 from pathlib import Path
 try:
-    from typing import Any, List, Literal, Optional
+    from typing import Any, Iterator, List, Literal, Optional
 except ImportError:  # pragma: no cover - Python 3.7 compatibility
-    from typing import Any, List, Optional
+    from typing import Any, Iterator, List, Optional
     try:
         from typing_extensions import Literal  # type: ignore
     except ImportError:
         Literal = str  # type: ignore[assignment]
 from uuid import uuid4
 
-from .crypto import decrypt_pii, encrypt_pii
-from .storage import append_jsonl, read_jsonl, storage_path, utc_timestamp, write_jsonl
+from .crypto import _get_fernet, decrypt_pii, decrypt_pii_many, encrypt_pii_many
+from .storage import append_jsonl, append_jsonl_batch, iter_jsonl, read_jsonl, storage_path, utc_timestamp, write_jsonl
 
 
 def _records_path() -> Path:
@@ -26,6 +26,11 @@ def _events_path() -> Path:
     return storage_path("escalation_events.jsonl")
 
 
+# Decrypted, normalized records keyed by the escalations.jsonl stat stamp and the
+# active Fernet instance, plus the same records grouped by course.
+_requests_cache: tuple[tuple[Any, ...], list[dict[str, Any]], dict[str, list[dict[str, Any]]]] | None = None
+
+
 EscalationStatus = Literal["new", "in_process", "contacted", "resolved"]
 VALID_STATUS: set[str] = {"new", "in_process", "contacted", "resolved"}
 
@@ -58,6 +63,9 @@ def _normalize_record(entry: dict[str, Any]) -> dict[str, Any]:
     return normalized
 
 
+_PII_FIELDS = ("student", "student_email")
+
+
 def _decrypt_record(entry: dict[str, Any]) -> dict[str, Any]:
     decrypted = {**entry}
     if "student" in decrypted:
@@ -67,23 +75,27 @@ def _decrypt_record(entry: dict[str, Any]) -> dict[str, Any]:
     return decrypted
 
 
+def _event(*, escalation_id: str, course_id: str, event_type: str, meta: dict[str, Any] | None = None) -> dict[str, Any]:
+    return {
+        "id": uuid4().hex,
+        "escalation_id": escalation_id,
+        "course_id": course_id,
+        "type": event_type,
+        "actor": "instructor",
+        "at": utc_timestamp(),
+        "meta": meta or {},
+    }
+
+
 def _append_event(*, escalation_id: str, course_id: str, event_type: str, meta: dict[str, Any] | None = None) -> None:
     append_jsonl(
         _events_path(),
-        {
-            "id": uuid4().hex,
-            "escalation_id": escalation_id,
-            "course_id": course_id,
-            "type": event_type,
-            "actor": "instructor",
-            "at": utc_timestamp(),
-            "meta": meta or {},
-        },
+        _event(escalation_id=escalation_id, course_id=course_id, event_type=event_type, meta=meta),
     )
 
 
-def append_request(payload: dict[str, Any]) -> dict[str, Any]:
-    """Persist a learner escalation request for instructor follow-up."""
+def _request_key(payload: dict[str, Any]) -> tuple[str, str]:
+    """Validate the required fields of an escalation payload and return its (course_id, question_id)."""
     from . import courses  # local import to avoid circular dependency
 
     course_id = str(payload.get("course_id") or "").strip()
@@ -97,68 +109,134 @@ def append_request(payload: dict[str, Any]) -> dict[str, Any]:
         raise ValueError("question is required")
     if courses.get_course(course_id) is None:
         raise ValueError("course_id is not recognized")
+    return course_id, question_id
+
+
+def append_request(payload: dict[str, Any]) -> dict[str, Any]:
+    """Persist a learner escalation request for instructor follow-up."""
+    return append_requests([payload])[0]
+
+
+def append_requests(payloads: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Persist several escalation requests, reading, encrypting, and appending in one pass each.
+
+    Returns one normalized record per payload, in order; payloads that repeat an
+    existing (course_id, question_id) return the stored record instead.
+    """
+    keys = [_request_key(payload) for payload in payloads]
 
     # Deduplicate on (course_id, question_id) to avoid duplicate rows and skewed analytics.
-    existing = [
-        rec
-        for rec in read_jsonl(_records_path())
-        if str(rec.get("course_id") or "") == course_id and str(rec.get("question_id") or "") == question_id
-    ]
-    if existing:
-        return _normalize_record(existing[0])
+    known: dict[tuple[str, str], dict[str, Any]] = {}
+    for rec in read_jsonl(_records_path()):
+        key = (str(rec.get("course_id") or ""), str(rec.get("question_id") or ""))
+        known.setdefault(key, rec)
+
+    fresh: dict[tuple[str, str], dict[str, Any]] = {}
+    for key, payload in zip(keys, payloads):
+        if key not in known and key not in fresh:
+            fresh[key] = payload
+
+    if not fresh:
+        return [_normalize_record(known[key]) for key in keys]
 
     # Encrypt PII fields before storage
-    student_name = payload.get("student_name") or ""
-    student_email = payload.get("student_email") or ""
-
-    requested_status = payload.get("status") or "new"
-    status = requested_status if str(requested_status) in VALID_STATUS else "new"
-
-    record = {
-        "id": payload.get("id") or uuid4().hex,
-        "question_id": question_id,
-        "question": question,
-        "student": encrypt_pii(student_name),
-        "student_email": encrypt_pii(student_email),
-        "course_id": course_id,
-        "submitted_at": payload.get("submitted_at") or utc_timestamp(),
-        "status": status,
-        "notes": payload.get("notes") or "",
-        "last_viewed_at": payload.get("last_viewed_at"),
-        "updated_at": payload.get("updated_at"),
-        "contacted_at": payload.get("contacted_at"),
-        "resolved_at": payload.get("resolved_at"),
-        "confidence": payload.get("confidence"),
-        "escalation_reason": payload.get("escalation_reason") or "low_confidence",
-        "delivered": bool(payload.get("delivered", False)),
-    }
-    normalized = _normalize_record(record)
-    append_jsonl(_records_path(), normalized)
-    _append_event(
-        escalation_id=str(normalized["id"]),
-        course_id=str(normalized.get("course_id") or ""),
-        event_type="created",
-        meta={"reason": normalized.get("escalation_reason"), "confidence": normalized.get("confidence")},
+    ciphertexts = encrypt_pii_many(
+        [
+            str(value or "")
+            for payload in fresh.values()
+            for value in (payload.get("student_name"), payload.get("student_email"))
+        ]
     )
-    return normalized
+
+    records: list[dict[str, Any]] = []
+    events: list[dict[str, Any]] = []
+    for idx, ((course_id, question_id), payload) in enumerate(fresh.items()):
+        requested_status = payload.get("status") or "new"
+        status = requested_status if str(requested_status) in VALID_STATUS else "new"
+        record = {
+            "id": payload.get("id") or uuid4().hex,
+            "question_id": question_id,
+            "question": (payload.get("question") or "").strip(),
+            "student": ciphertexts[2 * idx],
+            "student_email": ciphertexts[2 * idx + 1],
+            "course_id": course_id,
+            "submitted_at": payload.get("submitted_at") or utc_timestamp(),
+            "status": status,
+            "notes": payload.get("notes") or "",
+            "last_viewed_at": payload.get("last_viewed_at"),
+            "updated_at": payload.get("updated_at"),
+            "contacted_at": payload.get("contacted_at"),
+            "resolved_at": payload.get("resolved_at"),
+            "confidence": payload.get("confidence"),
+            "escalation_reason": payload.get("escalation_reason") or "low_confidence",
+            "delivered": bool(payload.get("delivered", False)),
+        }
+        normalized = _normalize_record(record)
+        records.append(normalized)
+        events.append(
+            _event(
+                escalation_id=str(normalized["id"]),
+                course_id=course_id,
+                event_type="created",
+                meta={"reason": normalized.get("escalation_reason"), "confidence": normalized.get("confidence")},
+            )
+        )
+        known[(course_id, question_id)] = normalized
+
+    append_jsonl_batch(_records_path(), records)
+    append_jsonl_batch(_events_path(), events)
+    return [_normalize_record(known[key]) for key in keys]
 
 
 def list_requests(course_id: str | None = None) -> List[dict[str, Any]]:
     """Return recorded escalation requests, optionally filtered by course."""
-    entries = read_jsonl(_records_path())
+    return list(iter_requests(course_id))
+
+
+def count_requests_by_course() -> dict[str, int]:
+    """Count recorded requests per course from the raw log, without decrypting PII."""
+    counts: dict[str, int] = {}
+    for entry in iter_jsonl(_records_path()):
+        cid = str(entry.get("course_id") or "")
+        counts[cid] = counts.get(cid, 0) + 1
+    return counts
 
-    # Decrypt PII fields for each entry
-    decrypted_entries = []
-    for entry in entries:
-        decrypted_entries.append(_decrypt_record(_normalize_record({**entry})))
 
-    if course_id is None:
-        return decrypted_entries
-    return [entry for entry in decrypted_entries if entry.get("course_id") == course_id]
+def iter_requests(course_id: str | None = None) -> Iterator[dict[str, Any]]:
+    """Yield recorded escalation requests without copying the cached list."""
+    entries, by_course = _decrypted_requests()
+    return iter(entries if course_id is None else by_course.get(course_id, ()))
+
+
+def _decrypted_requests() -> tuple[list[dict[str, Any]], dict[str, list[dict[str, Any]]]]:
+    """Return all decrypted records and a per-course index, re-reading only on change."""
+    global _requests_cache
+    path = _records_path()
+    try:
+        stat = path.stat()
+        file_stamp: tuple[Any, ...] = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        file_stamp = (0, 0, 0)
+    stamp = (path, *file_stamp, _get_fernet())
+    cached = _requests_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1], cached[2]
+
+    # Normalizing already copies each entry, so PII fields are decrypted in place in one batch.
+    entries = [_normalize_record(entry) for entry in read_jsonl(path)]
+    pii_slots = [(entry, field) for entry in entries for field in _PII_FIELDS if field in entry]
+    plaintexts = decrypt_pii_many([str(entry[field]) for entry, field in pii_slots])
+    for (entry, field), plaintext in zip(pii_slots, plaintexts):
+        entry[field] = plaintext
+    by_course: dict[str, list[dict[str, Any]]] = {}
+    for entry in entries:
+        by_course.setdefault(entry.get("course_id"), []).append(entry)
+    _requests_cache = (stamp, entries, by_course)
+    return entries, by_course
 
 
 def get_request(escalation_id: str) -> dict[str, Any] | None:
-    for entry in list_requests(course_id=None):
+    for entry in iter_requests(course_id=None):
         if str(entry.get("id") or "") == escalation_id:
             return entry
     return None
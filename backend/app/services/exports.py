@@ -39,7 +39,9 @@ except ImportError:  # pragma: no cover - Python 3.7 compatibility
             def dst(self, _dt):  # type: ignore[override]
                 return timedelta(0)
 
-from . import courses
+import numpy as np
+
+from . import analytics, courses
 from .crypto import decrypt_pii
 from .storage import read_json, storage_path
 from ..settings import settings
@@ -170,6 +172,8 @@ def load_raw_component(
     include_pii: bool,
 ) -> list[dict[str, Any]] | dict[str, Any]:
     if component == "raw_interactions":
+        # Interaction lines are buffered in memory; make sure they are on disk.
+        analytics.flush_summary()
         return _filter_by_course_and_range(
             _read_jsonl_limited("interactions.jsonl"),
             course_id=course_id,
@@ -247,33 +251,24 @@ def compute_insights_components(
     if not isinstance(interactions, list):
         interactions = []
 
-    totals_questions = 0
-    confidence_sum = 0.0
-    confidence_count = 0
     helpful_total = 0
     feedback_total = 0
     question_counts: dict[str, int] = {}
-    daily_volume: dict[str, int] = {}
-    confidence_daily: dict[str, dict[str, float | int]] = {}
     feedback_by_question: dict[str, dict[str, int]] = {}
+    # Columnar view of "ask" events: local day ordinal and confidence (NaN if missing).
+    ask_days: list[int] = []
+    ask_confidences: list[float] = []
 
     for event in interactions:
         event_type = event.get("type")
         event_ts = _parse_timestamp(event.get("timestamp"))
         if event_ts is None:
             continue
-        day_key = event_ts.astimezone(tz).date().isoformat()
 
         if event_type == "ask":
-            totals_questions += 1
-            daily_volume[day_key] = daily_volume.get(day_key, 0) + 1
+            ask_days.append(event_ts.astimezone(tz).date().toordinal())
             confidence = event.get("confidence")
-            if isinstance(confidence, (int, float)):
-                confidence_sum += float(confidence)
-                confidence_count += 1
-                bucket = confidence_daily.setdefault(day_key, {"sum": 0.0, "count": 0})
-                bucket["sum"] = float(bucket["sum"]) + float(confidence)
-                bucket["count"] = int(bucket["count"]) + 1
+            ask_confidences.append(float(confidence) if isinstance(confidence, (int, float)) else np.nan)
             question = event.get("question")
             if question:
                 question_counts[str(question)] = question_counts.get(str(question), 0) + 1
@@ -288,9 +283,25 @@ def compute_insights_components(
                 if bool(event.get("helpful")):
                     stats["helpful"] += 1
 
-    avg_confidence = confidence_sum / confidence_count if confidence_count else 0.0
+    # Ensure continuous date series for charts (last 30 days in selected tz).
+    today = datetime.now(tz).date()
+    days = np.asarray(ask_days, dtype=np.int64) - (today.toordinal() - 29)
+    confidences = np.asarray(ask_confidences, dtype=np.float64)
+    scored = ~np.isnan(confidences)
+    in_window = (days >= 0) & (days < 30)
+    scored_in_window = scored & in_window
+
+    totals_questions = int(days.size)
+    confidence_count = int(np.count_nonzero(scored))
+    avg_confidence = float(confidences[scored].sum()) / confidence_count if confidence_count else 0.0
     helpful_rate = helpful_total / feedback_total if feedback_total else 0.0
 
+    volume = np.bincount(days[in_window], minlength=30)
+    confidence_totals = np.bincount(
+        days[scored_in_window], weights=confidences[scored_in_window], minlength=30
+    )
+    confidence_counts = np.bincount(days[scored_in_window], minlength=30)
+
     top_questions = sorted(
         ({"label": label, "count": count} for label, count in question_counts.items()),
         key=lambda item: item["count"],
@@ -318,19 +329,14 @@ def compute_insights_components(
     pain_points.sort(key=lambda entry: entry["change"], reverse=True)
     pain_points = pain_points[:5]
 
-    # Ensure continuous date series for charts (last 30 days in selected tz).
-    last_30_days = [
-        (datetime.now(tz).date() - timedelta(days=offset)).isoformat()
-        for offset in reversed(range(30))
+    last_30_days = [(today - timedelta(days=offset)).isoformat() for offset in reversed(range(30))]
+    daily_volume_rows = [
+        {"date": day, "count": int(count)} for day, count in zip(last_30_days, volume.tolist())
+    ]
+    confidence_rows = [
+        {"date": day, "confidence": round(total / count, 2) if count else 0.0}
+        for day, total, count in zip(last_30_days, confidence_totals.tolist(), confidence_counts.tolist())
     ]
-    daily_volume_rows = [{"date": day, "count": daily_volume.get(day, 0)} for day in last_30_days]
-    confidence_rows = []
-    for day in last_30_days:
-        bucket = confidence_daily.get(day)
-        if bucket and bucket.get("count"):
-            confidence_rows.append({"date": day, "confidence": round(float(bucket["sum"]) / int(bucket["count"]), 2)})
-        else:
-            confidence_rows.append({"date": day, "confidence": 0.0})
 
     insights_escalations = [
         {
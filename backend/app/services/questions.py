@@ -5,7 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from .storage import append_jsonl, read_jsonl, storage_path
+from .storage import append_jsonl, append_jsonl_batch, read_jsonl, storage_path
 
 
 def _answers_path() -> Path:
@@ -18,6 +18,11 @@ def record_answer(payload: dict[str, Any]) -> None:
     append_jsonl(_answers_path(), payload)
 
 
+def record_answers(payloads: list[dict[str, Any]]) -> None:
+    """Persist several answer records with a single append."""
+    append_jsonl_batch(_answers_path(), payloads)
+
+
 def lookup_answer(question_id: str) -> dict[str, Any] | None:
     """Look up a recorded answer by question ID."""
     for entry in reversed(read_jsonl(_answers_path())):
@@ -6,8 +6,14 @@ import json
 import logging
 import tempfile
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional fast path
+    orjson = None  # type: ignore[assignment]
 
 from ..settings import settings
 
@@ -29,22 +35,28 @@ def storage_path(name: str) -> Path:
     # Prevent path traversal attacks
     if ".." in name or "/" in name or "\\" in name or name.startswith("."):
         raise ValueError(f"Invalid storage filename: {name}")
+    return _resolve_storage_path(settings.storage_dir, name)
+
+
+@lru_cache(maxsize=256)
+def _resolve_storage_path(storage_dir: Path, name: str) -> Path:
+    """Resolve a validated name once per storage directory; writers re-create the directory."""
     ensure_storage()
-    resolved = (settings.storage_dir / name).resolve()
+    resolved = (storage_dir / name).resolve()
     # Ensure the resolved path is within the storage directory
-    if not str(resolved).startswith(str(settings.storage_dir.resolve())):
+    if not str(resolved).startswith(str(storage_dir.resolve())):
         raise ValueError(f"Path traversal detected: {name}")
     return resolved
 
 
 def read_json(path: Path, default: Any) -> Any:
     """Read JSON from a file, returning a default if missing or invalid."""
-    if not path.exists():
-        return default
     try:
-        content = path.read_text(encoding="utf-8")
-        return json.loads(content) if content.strip() else default
-    except (json.JSONDecodeError, OSError) as exc:
+        content = path.read_bytes()
+        return _loads(content) if content.strip() else default
+    except FileNotFoundError:
+        return default
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as exc:
         logger.warning("Failed to read JSON from %s: %s", path, exc)
         return default
 
@@ -52,8 +64,28 @@ def read_json(path: Path, default: Any) -> Any:
 def write_json(path: Path, payload: Any) -> None:
     """Write JSON to a file atomically."""
     ensure_storage()
-    content = json.dumps(payload, indent=2, ensure_ascii=True)
-    _atomic_write(path, content)
+    _atomic_write(path, _dumps(payload))
+
+
+def _loads(content: bytes) -> Any:
+    """Parse JSON bytes, preferring orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity literals that stdlib json may have written.
+            pass
+    return json.loads(content.decode("utf-8"))
+
+
+def _dumps(payload: Any) -> str | bytes:
+    """Serialize a payload as indented JSON, preferring orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(payload, indent=2, ensure_ascii=True)
 
 
 def append_jsonl(path: Path, record: dict[str, Any]) -> None:
@@ -63,19 +95,67 @@ def append_jsonl(path: Path, record: dict[str, Any]) -> None:
         handle.write(json.dumps(record, ensure_ascii=True) + "\n")
 
 
+def append_jsonl_batch(path: Path, records: Iterable[dict[str, Any]]) -> tuple[int, int] | None:
+    """Append several JSON records to a JSONL file with a single write.
+
+    Returns the ``(start, end)`` byte offsets the lines landed at, or None when
+    there was nothing to write. The file is opened in append mode, so the
+    offsets stay correct when other processes append concurrently.
+    """
+    data = "".join(json.dumps(record, ensure_ascii=True) + "\n" for record in records).encode("ascii")
+    if not data:
+        return None
+    ensure_storage()
+    with path.open("ab") as handle:
+        handle.write(data)
+        handle.flush()
+        end = handle.tell()
+    return end - len(data), end
+
+
 def read_jsonl(path: Path) -> list[dict[str, Any]]:
     """Read all records from a JSONL file."""
+    return list(iter_jsonl(path))
+
+
+def iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    """Yield records from a JSONL file one line at a time."""
     if not path.exists():
-        return []
-    records: list[dict[str, Any]] = []
-    for line_num, line in enumerate(path.read_text(encoding="utf-8").splitlines(), start=1):
-        if not line.strip():
-            continue
-        try:
-            records.append(json.loads(line))
-        except json.JSONDecodeError as exc:
-            logger.warning("Skipped malformed JSON at %s:%d: %s", path, line_num, exc)
-    return records
+        return
+    with path.open("rb") as handle:
+        for line_num, line in enumerate(handle, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield _loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                logger.warning("Skipped malformed JSON at %s:%d: %s", path, line_num, exc)
+
+
+def iter_jsonl_from(
+    path: Path, offset: int = 0, end: int | None = None
+) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    """Yield ``(end_offset, record)`` for each complete JSONL line in ``[offset, end)``.
+
+    Malformed lines yield ``None`` so callers can still advance past them. A
+    final line without a newline is treated as still being written and skipped.
+    """
+    if not path.exists():
+        return
+    with path.open("rb") as handle:
+        handle.seek(offset)
+        position = offset
+        for line in handle:
+            if not line.endswith(b"\n") or (end is not None and position + len(line) > end):
+                return
+            position += len(line)
+            if not line.strip():
+                continue
+            try:
+                yield position, _loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError) as exc:
+                logger.warning("Skipped malformed JSON at %s (byte %d): %s", path, position - len(line), exc)
+                yield position, None
 
 
 def write_jsonl(path: Path, records: Iterable[dict[str, Any]]) -> None:
@@ -85,16 +165,16 @@ def write_jsonl(path: Path, records: Iterable[dict[str, Any]]) -> None:
     _atomic_write(path, "\n".join(lines) + "\n" if lines else "")
 
 
-def _atomic_write(path: Path, content: str) -> None:
+def _atomic_write(path: Path, content: str | bytes) -> None:
     """Write content to a file atomically using a temporary file."""
     ensure_storage()
+    data = content.encode("utf-8") if isinstance(content, str) else content
     with tempfile.NamedTemporaryFile(
-        mode="w",
-        encoding="utf-8",
+        mode="wb",
         dir=path.parent,
         delete=False,
         suffix=".tmp",
     ) as tmp:
-        tmp.write(content)
+        tmp.write(data)
         tmp_path = Path(tmp.name)
     tmp_path.replace(path)
@@ -64,15 +64,29 @@ class Settings(BaseSettings):
         embed_model: Sentence transformer model for embeddings.
         qdrant_host: Hostname of the Qdrant vector store.
         qdrant_port: Port number for Qdrant connection.
+        qdrant_grpc_port: Port number for Qdrant gRPC connection.
+        qdrant_prefer_grpc: Whether to talk to Qdrant over gRPC instead of HTTP/JSON.
+        qdrant_timeout_seconds: Request timeout for Qdrant calls.
         qdrant_collection: Name of the Qdrant collection.
         qdrant_location: Optional path for local Qdrant (e.g., ':memory:').
+        qdrant_upsert_concurrency: Concurrent Qdrant writes during ingestion.
+        qdrant_upsert_batch: Maximum points per Qdrant upsert request.
+        qdrant_scalar_quantization: Whether new collections store int8-quantized vectors.
+        qdrant_stub_quantization: Whether the offline in-memory stub stores int8 vectors.
         data_dir: Directory containing course materials to ingest.
         storage_dir: Directory for persisting feedback and analytics.
         llm_mode: Generation mode ('hf' for Hugging Face, 'off' for extractive).
         hf_model: Hugging Face model identifier for generation.
         hf_max_new_tokens: Maximum tokens to generate per response.
+        hf_runtime: Generation runtime ('torch' for FP32 PyTorch, 'onnx' for INT8 ONNX Runtime).
         retrieval_top_k: Number of chunks to retrieve per query.
+        retrieval_filtered_overfetch: Candidate multiplier for course-filtered searches.
+        retrieval_cache_ttl_seconds: Seconds to reuse retrieve() results for a repeated query (0 disables).
         embedding_batch_size: Batch size for embedding generation.
+        embedding_workers: Worker processes used to embed chunks during ingestion.
+        query_batch_window_ms: Opt-in window for coalescing concurrent query embeddings (0 disables).
+        cache_answers: Whether to serve repeated /ask questions from the answer cache.
+        answer_cache_similarity: Minimum cosine similarity for a semantic cache hit.
         escalation_confidence_threshold: Confidence below which to suggest escalation.
         analytics_history_days: Days of analytics history to retain.
     """
@@ -89,8 +103,31 @@ class Settings(BaseSettings):
     # Qdrant vector store configuration
     qdrant_host: str = "qdrant"
     qdrant_port: int = Field(default=6333, ge=1, le=65535)
+    qdrant_grpc_port: int = Field(default=6334, ge=1, le=65535)
+    qdrant_prefer_grpc: bool = True
+    qdrant_timeout_seconds: int = Field(default=60, ge=1, le=600)
     qdrant_collection: str = "lena_pilot"
     qdrant_location: Optional[str] = None
+    qdrant_upsert_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Documents written to Qdrant concurrently during ingestion.",
+    )
+    qdrant_upsert_batch: int = Field(
+        default=64,
+        ge=1,
+        le=2048,
+        description="Maximum points per Qdrant upsert request (large requests risk timeouts).",
+    )
+    qdrant_scalar_quantization: bool = Field(
+        default=True,
+        description="Create collections with int8 scalar quantization (applies when a collection is created).",
+    )
+    qdrant_stub_quantization: bool = Field(
+        default=False,
+        description="Store int8 codes plus a per-row scale in the in-memory Qdrant stub (approximate scores).",
+    )
 
     # File paths
     data_dir: Path = Field(default=PROJECT_ROOT / "data")
@@ -100,10 +137,53 @@ class Settings(BaseSettings):
     llm_mode: Literal["hf", "off"] = "hf"
     hf_model: str = "HuggingFaceH4/zephyr-7b-beta"
     hf_max_new_tokens: int = Field(default=256, ge=1, le=2048)
+    hf_runtime: Literal["torch", "onnx"] = Field(
+        default="torch",
+        description="Generation runtime; 'onnx' exports and INT8-quantizes the model via optimum[onnxruntime].",
+    )
 
     # Retrieval settings
     retrieval_top_k: int = Field(default=6, ge=1, le=50)
+    retrieval_filtered_overfetch: int = Field(
+        default=4,
+        ge=1,
+        le=20,
+        description="Fetch top_k times this many candidates when a course filter applies, keeping the semantic top_k.",
+    )
+    retrieval_cache_ttl_seconds: int = Field(
+        default=300,
+        ge=0,
+        le=86400,
+        description="Reuse retrieval results for a repeated (course, query, top_k) within this many seconds; 0 disables.",
+    )
     embedding_batch_size: int = Field(default=16, ge=1, le=256)
+    embedding_workers: int = Field(
+        default=1,
+        ge=1,
+        le=64,
+        description="Processes used to embed chunks during ingestion (1 = encode in-process).",
+    )
+    query_batch_window_ms: int = Field(
+        default=0,
+        ge=0,
+        le=100,
+        description=(
+            "Milliseconds to wait for concurrent /ask queries to share one embedding batch "
+            "(0 = off; each query is encoded on its own worker thread)."
+        ),
+    )
+
+    # Answer cache
+    cache_answers: bool = Field(
+        default=False,
+        description="Serve repeated /ask questions per course from an in-process answer cache.",
+    )
+    answer_cache_similarity: float = Field(
+        default=0.92,
+        ge=0.0,
+        le=1.0,
+        description="Cosine similarity needed for a semantic answer-cache hit (1.0 = exact match only).",
+    )
 
     # Escalation and analytics
     escalation_confidence_threshold: float = Field(default=0.55, ge=0.0, le=1.0)
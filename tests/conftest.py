@@ -27,7 +27,7 @@ os.environ.setdefault("LENA_ALLOW_DEFAULT_INSTRUCTOR_CREDS", "true")
 
 from backend.app.models import embeddings  # noqa: E402
 from backend.app.rag.ingest import run_ingest  # noqa: E402
-from backend.app.rag.qdrant_utils import get_qdrant_client  # noqa: E402
+from backend.app.rag.qdrant_utils import get_qdrant_client, reset_collection_cache  # noqa: E402
 from backend.app.settings import settings  # noqa: E402
 
 
@@ -59,7 +59,7 @@ def ingest_sample_corpus(tmp_path_factory):
         def __init__(self, *_, **__):
             self._dim = 16
 
-        def encode(self, text: Union[str, list]):
+        def encode(self, text: Union[str, list], **_):
             if isinstance(text, list):
                 return np.array([self.encode(t) for t in text])
             seed = abs(hash(text)) % (10**6)
@@ -87,6 +87,7 @@ def ingest_sample_corpus(tmp_path_factory):
         client.delete_collection(settings.qdrant_collection)
     except Exception:
         pass
+    reset_collection_cache()
 
     result = run_ingest(data_dir=temp_dir)
     assert result.ok
@@ -67,6 +67,24 @@ def test_courses_endpoint_returns_seed_data(ingest_sample_corpus):
     assert {"id", "name"}.issubset(first.keys())
 
 
+def test_course_catalog_reloads_after_instructor_edit(ingest_sample_corpus):
+    client = TestClient(app)
+    headers = _auth_headers(client)
+    assert courses.get_course("catalog-test") is None
+
+    created = client.post(
+        "/instructors/courses",
+        json={"id": "catalog-test", "name": "Catalog Test"},
+        headers=headers,
+    )
+    assert created.status_code == 200
+    assert courses.get_course("catalog-test")["name"] == "Catalog Test"
+
+    removed = client.delete("/instructors/courses/catalog-test", headers=headers)
+    assert removed.status_code == 200
+    assert courses.get_course("catalog-test") is None
+
+
 def test_escalation_request_is_logged(ingest_sample_corpus):
     client = TestClient(app)
     ask_response = client.post(
@@ -153,3 +171,104 @@ def test_course_filter_blocks_cross_course_content(ingest_sample_corpus):
     )
     assert anth101_response.status_code == 200
     assert "Unique Anth204 fact" not in anth101_response.json()["answer"]
+
+
+def test_ask_endpoint_serves_repeated_question_from_cache(ingest_sample_corpus, monkeypatch):
+    from backend.app.api.routes import chat as chat_route
+    from backend.app.services import answer_cache
+    from backend.app.settings import settings
+
+    monkeypatch.setattr(settings, "cache_answers", True)
+    monkeypatch.setattr(settings, "answer_cache_similarity", 1.0)
+    answer_cache.clear()
+    calls = []
+    original_retrieve = chat_route.retrieve
+
+    def counting_retrieve(*args, **kwargs):
+        calls.append(args)
+        return original_retrieve(*args, **kwargs)
+
+    monkeypatch.setattr(chat_route, "retrieve", counting_retrieve)
+    client = TestClient(app)
+    try:
+        first = client.post("/ask", json={"question": "When is Assignment 1 due?", "course_id": _course_id()})
+        second = client.post("/ask", json={"question": "  when is assignment 1 DUE? ", "course_id": _course_id()})
+    finally:
+        answer_cache.clear()
+
+    assert first.status_code == 200 and second.status_code == 200
+    assert len(calls) == 1
+    assert second.json()["answer"] == first.json()["answer"]
+    assert second.json()["question_id"] != first.json()["question_id"]
+
+
+def test_ask_endpoint_embeds_question_once_for_cache_and_retrieval(ingest_sample_corpus, monkeypatch):
+    from backend.app.models.embeddings import get_embedder
+    from backend.app.rag import retrieve as retrieve_module
+    from backend.app.services import answer_cache
+    from backend.app.settings import settings
+
+    monkeypatch.setattr(settings, "cache_answers", True)
+    monkeypatch.setattr(settings, "answer_cache_similarity", 0.95)
+    answer_cache.clear()
+    retrieve_module._encode_query.cache_clear()
+    question = "How many late days are allowed per assignment?"
+    embedder = get_embedder()
+    encoded = []
+    original_encode = embedder.encode
+
+    def counting_encode(texts, *args, **kwargs):
+        encoded.append(texts)
+        return original_encode(texts, *args, **kwargs)
+
+    monkeypatch.setattr(embedder, "encode", counting_encode)
+    client = TestClient(app)
+    try:
+        response = client.post("/ask", json={"question": question, "course_id": _course_id()})
+    finally:
+        answer_cache.clear()
+
+    assert response.status_code == 200
+    assert [text for text in encoded if str(text).lower() == question.lower()] == [question]
+
+
+def test_deleted_course_is_restored_by_reingest(ingest_sample_corpus, tmp_path, monkeypatch):
+    from backend.app.rag import ingest
+    from backend.app.rag.qdrant_utils import get_qdrant_client, qmodels
+    from backend.app.settings import settings
+
+    def course_points() -> int:
+        hits = get_qdrant_client().search(
+            collection_name=settings.qdrant_collection,
+            query_vector=[0.0] * 384,
+            limit=100,
+            with_payload=True,
+            with_vectors=False,
+            query_filter=qmodels.Filter(
+                must=[qmodels.FieldCondition(key="course_id", match=qmodels.MatchValue(value="anth399"))]
+            ),
+        )
+        return len(hits)
+
+    monkeypatch.setattr(settings, "uploads_dir", tmp_path / "no-uploads")
+    data_dir = tmp_path / "data"
+    (data_dir / "anth399").mkdir(parents=True)
+    (data_dir / "anth399" / "syllabus.md").write_text("# Syllabus\nFieldwork journals are due weekly.", encoding="utf-8")
+    client = TestClient(app)
+    headers = _auth_headers(client)
+    created = client.post(
+        "/instructors/courses",
+        json={"id": "anth399", "name": "Field Methods", "code": "ANTH 399", "term": "Fall"},
+        headers=headers,
+    )
+    assert created.status_code == 200
+    assert ingest.run_ingest(data_dir=data_dir).counts.chunks > 0
+    assert course_points() > 0
+
+    deleted = client.delete("/instructors/courses/anth399", headers=headers)
+    assert deleted.status_code == 200
+    assert course_points() == 0
+
+    restored = ingest.run_ingest(data_dir=data_dir)
+    assert restored.counts.docs == 1 and restored.counts.chunks > 0
+    assert course_points() > 0
@@ -52,3 +52,34 @@ def test_escalation_append_with_encryption(monkeypatch, tmp_path: Path):
     )
     assert record["student"] != "Bob"
     assert (tmp_path / "escalations.jsonl").exists()
+
+
+@pytest.mark.parametrize(
+    "email, ok",
+    [
+        ("alice@example.edu", True),
+        (" alice@mail.example.edu ", True),
+        ("alice.example.edu", False),
+        ("@example.edu", False),
+        ("alice@example", False),
+        ("alice@example.", False),
+        ("a@b@example.edu", False),
+    ],
+)
+def test_escalation_request_email_shape(email, ok):
+    from pydantic import ValidationError
+
+    from backend.app.schemas.feedback import EscalationRequest
+
+    payload = {
+        "question_id": "q1",
+        "question": "What time is class?",
+        "student_name": "Alice",
+        "student_email": email,
+        "course_id": "c1",
+    }
+    if ok:
+        assert EscalationRequest(**payload).student_email == email.strip()
+    else:
+        with pytest.raises(ValidationError):
+            EscalationRequest(**payload)
@@ -63,3 +63,30 @@ def test_append_request_deduplicates_by_course_and_question(tmp_path, monkeypatc
     assert len(records) == 1
     # Status should remain the original (contacted is valid) not overwritten by duplicate
     assert records[0]["status"] == "contacted"
+
+
+def test_append_requests_batches_and_deduplicates(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "storage_dir", tmp_path)
+    (tmp_path / "courses.json").write_text(
+        '[{"id": "courseA", "name": "Course A"}]',
+        encoding="utf-8",
+    )
+    payloads = [
+        {
+            "question_id": f"q{idx}",
+            "question": f"Question {idx}",
+            "student_name": f"Student {idx}",
+            "student_email": f"student{idx}@example.com",
+            "course_id": "courseA",
+        }
+        for idx in (1, 2, 1)
+    ]
+
+    records = escalations.append_requests(payloads)
+
+    assert [r["question_id"] for r in records] == ["q1", "q2", "q1"]
+    assert records[0]["id"] == records[2]["id"]
+    raw = _read_escalations_raw()
+    assert len(raw) == 2
+    assert all(str(r["student"]).startswith("ENC:") for r in raw)
+    assert [r["student"] for r in escalations.list_requests("courseA")] == ["Student 1", "Student 2"]
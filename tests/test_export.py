@@ -172,3 +172,28 @@ def test_export_custom_range_filters_by_local_date(isolated_client, auth_headers
     questions = {row.get("question") for row in payload}
     assert "late" in questions
     assert "early" not in questions
+
+
+def test_insights_daily_series_bucket_by_local_day(isolated_client):
+    from backend.app.services.exports import DateRange, compute_insights_components, resolve_timezone
+
+    now = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0, microsecond=0)
+    stamp = now.isoformat().replace("+00:00", "Z")
+    _write_event("anth101", "ask", stamp, question="a", confidence=0.6)
+    _write_event("anth101", "ask", stamp, question="a", confidence=1.0)
+    _write_event("anth101", "ask", stamp, question="b")
+    _write_event("anth101", "ask", "2020-01-01T00:00:00Z", question="old", confidence=0.2)
+
+    insights = compute_insights_components(
+        course_id="anth101",
+        date_range=DateRange(None, None),
+        tz=resolve_timezone("UTC"),
+        include_pii=False,
+    )
+    today = now.date().isoformat()
+    assert insights["insights_totals"]["questions"] == 4
+    assert insights["insights_totals"]["average_confidence"] == 0.6
+    assert insights["insights_daily_volume"][-1] == {"date": today, "count": 3}
+    assert insights["insights_confidence_trend"][-1] == {"date": today, "confidence": 0.8}
+    assert sum(row["count"] for row in insights["insights_daily_volume"]) == 3
+    assert insights["insights_top_questions"][0] == {"label": "a", "count": 2}
@@ -22,3 +22,23 @@ def test_generate_fallback_to_extractive(monkeypatch):
     assert "Here is what I found" in answer
 
     settings.llm_mode = previous_mode
+
+
+def test_onnx_runtime_falls_back_to_torch_when_optimum_missing(monkeypatch):
+    """Selecting the ONNX runtime without optimum installed should load the PyTorch pipeline."""
+    calls = []
+
+    def fake_pipeline(task, **kwargs):
+        calls.append((task, kwargs))
+        return lambda *_args, **_kwargs: [{"generated_text": "ok"}]
+
+    monkeypatch.setattr(settings, "hf_runtime", "onnx")
+    monkeypatch.setattr(generate_module, "ORTModelForCausalLM", None)
+    monkeypatch.setattr(generate_module, "pipeline", fake_pipeline)
+    generate_module.get_generator.cache_clear()
+    try:
+        generate_module.get_generator()
+    finally:
+        generate_module.get_generator.cache_clear()
+
+    assert calls and calls[0][1]["model"] == settings.hf_model
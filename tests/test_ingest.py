@@ -0,0 +1,81 @@
+import os
+
+import pytest
+
+from backend.app.rag import ingest
+from backend.app.settings import settings
+
+
+def test_reingest_skips_unchanged_documents(ingest_sample_corpus, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "uploads_dir", tmp_path / "no-uploads")
+    doc = tmp_path / "anth310" / "notes.md"
+    doc.parent.mkdir()
+    doc.write_text("# Notes\nField notes are due every Friday.", encoding="utf-8")
+
+    first = ingest.run_ingest(data_dir=tmp_path)
+    assert first.counts.docs == 1 and first.counts.chunks > 0
+
+    second = ingest.run_ingest(data_dir=tmp_path)
+    assert second.counts.docs == 0 and second.counts.chunks == 0
+
+    # Touching the file without changing its bytes is detected via the content hash.
+    stat = doc.stat()
+    os.utime(doc, (stat.st_atime, stat.st_mtime + 10))
+    touched = ingest.run_ingest(data_dir=tmp_path)
+    assert touched.counts.docs == 0
+
+    doc.write_text("# Notes\nField notes are now due every Monday.", encoding="utf-8")
+    os.utime(doc, (stat.st_atime, stat.st_mtime + 20))
+    changed = ingest.run_ingest(data_dir=tmp_path)
+    assert changed.counts.docs == 1 and changed.counts.chunks > 0
+
+
+def test_failed_qdrant_update_is_not_recorded_in_manifest(ingest_sample_corpus, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "uploads_dir", tmp_path / "no-uploads")
+    doc = tmp_path / "anth310" / "syllabus.md"
+    doc.parent.mkdir()
+    doc.write_text("# Syllabus\nThe final project is due in week 14.", encoding="utf-8")
+    real_replace = ingest.replace_document_chunks
+
+    def failing_replace(*args, **kwargs):
+        raise RuntimeError("qdrant unavailable")
+
+    monkeypatch.setattr(ingest, "replace_document_chunks", failing_replace)
+    with pytest.raises(RuntimeError):
+        ingest.run_ingest(data_dir=tmp_path)
+    monkeypatch.setattr(ingest, "replace_document_chunks", real_replace)
+
+    retry = ingest.run_ingest(data_dir=tmp_path)
+    assert retry.counts.docs == 1 and retry.counts.chunks > 0
+
+
+def test_caches_are_cleared_only_after_updates_are_applied(ingest_sample_corpus, tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "uploads_dir", tmp_path / "no-uploads")
+    doc = tmp_path / "anth310" / "schedule.md"
+    doc.parent.mkdir()
+    doc.write_text("# Schedule\nThe midterm moved to week 9.", encoding="utf-8")
+
+    class DeferredApplyClient:
+        """Proxy that, like a remote Qdrant, only applies wait=False updates later."""
+
+        def __init__(self, client):
+            self._client = client
+            self.deferred = []
+
+        def batch_update_points(self, collection_name, update_operations, wait=True):
+            if wait:
+                self._client.batch_update_points(collection_name, update_operations, wait=True)
+            else:
+                self.deferred.append((collection_name, update_operations))
+
+        def __getattr__(self, name):
+            return getattr(self._client, name)
+
+    proxy = DeferredApplyClient(ingest.get_qdrant_client())
+    monkeypatch.setattr(ingest, "get_qdrant_client", lambda: proxy)
+    cleared = []
+    monkeypatch.setattr(ingest, "clear_retrieval_cache", lambda: cleared.append(list(proxy.deferred)))
+
+    result = ingest.run_ingest(data_dir=tmp_path)
+    assert result.counts.docs == 1
+    assert cleared == [[]]
@@ -1,10 +1,12 @@
 import sys
 
 import numpy as np
+import pytest
 
 from backend.app.rag.retrieve import retrieve
 from backend.app.models import embeddings as embeddings_module
 from backend.app.services import courses
+from backend.app.settings import settings
 
 
 def _course_id() -> str:
@@ -56,3 +58,192 @@ def test_embedding_fallback_dummy_encoder(monkeypatch):
     assert hasattr(embedder, "get_sentence_embedding_dimension")
     assert len(vec) == embedder.get_sentence_embedding_dimension()
     assert isinstance(vec, np.ndarray)
+
+
+def test_fallback_prefers_best_keyword_match(tmp_path, monkeypatch):
+    from backend.app.rag import retrieve as retrieve_module
+
+    (tmp_path / "a-intro.md").write_text("# Welcome\nCourse overview.", encoding="utf-8")
+    (tmp_path / "b-grading.md").write_text("# Grading\nRubric weights for essays.", encoding="utf-8")
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+
+    chunks = retrieve_module._fallback_local_chunks("How are essays graded with the rubric?", None)
+    assert chunks and chunks[0].metadata["source_path"] == "b-grading.md"
+
+
+def test_concurrent_query_encodes_share_a_batch(monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    class CountingEmbedder:
+        def __init__(self):
+            self.calls = 0
+
+        def encode(self, text, **_):
+            self.calls += 1
+            texts = text if isinstance(text, list) else [text]
+            vectors = np.array([[float(len(t)), 1.0] for t in texts])
+            return vectors if isinstance(text, list) else vectors[0]
+
+    embedder = CountingEmbedder()
+    monkeypatch.setattr(settings, "query_batch_window_ms", 200)
+    questions = ["a", "bb", "ccc", "dddd"]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        vectors = list(pool.map(lambda q: embeddings_module.encode_query(q, embedder), questions))
+
+    assert [v[0] for v in vectors] == [1.0, 2.0, 3.0, 4.0]
+    assert embedder.calls < len(questions)
+
+
+def test_query_encode_is_direct_by_default():
+    import threading
+
+    class ThreadRecordingEmbedder:
+        def encode(self, text, **_):
+            self.thread = threading.current_thread()
+            return np.array([1.0, 0.0])
+
+    embedder = ThreadRecordingEmbedder()
+    assert settings.query_batch_window_ms == 0
+    embeddings_module.encode_query("When is the final?", embedder)
+    assert embedder.thread is threading.current_thread()
+
+
+def test_degenerate_query_skips_search(monkeypatch):
+    from backend.app.rag import retrieve as retrieve_module
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("degenerate queries should not be embedded")
+
+    monkeypatch.setattr(retrieve_module, "_encode_query", fail)
+    assert retrieve("?! .. a", course_id=_course_id()) == []
+
+
+def test_retrieve_memoizes_until_cleared(monkeypatch):
+    from backend.app.rag import retrieve as retrieve_module
+
+    calls = []
+
+    def fake_retrieve(query, top_k, course_id):
+        calls.append(query)
+        return []
+
+    monkeypatch.setattr(retrieve_module, "_retrieve", fake_retrieve)
+    retrieve_module.clear_retrieval_cache()
+    retrieve("Office hours location?", course_id="anth101")
+    retrieve("Office  hours location?", course_id="anth101")
+    assert len(calls) == 1
+
+    retrieve_module.clear_retrieval_cache("anth101")
+    retrieve("Office hours location?", course_id="anth101")
+    assert len(calls) == 2
+    retrieve_module.clear_retrieval_cache()
+
+
+def test_keyword_bias_only_reorders_the_semantic_top_k(tmp_path, monkeypatch):
+    from types import SimpleNamespace
+
+    from backend.app.rag import retrieve as retrieve_module
+
+    def hit(idx: int, title: str) -> SimpleNamespace:
+        return SimpleNamespace(
+            id=str(idx),
+            score=1.0 - idx / 100,
+            payload={"text": f"chunk {idx}", "title": title, "section": None, "source_path": f"zz999/{idx}.md"},
+        )
+
+    # Over-fetched results: the keyword matches sit below the semantic top 2.
+    hits = [hit(0, "Week one"), hit(1, "Week two"), hit(2, "Midterm review"), hit(3, "Midterm room")]
+
+    class FakeClient:
+        def search(self, **kwargs):
+            return hits[: kwargs["limit"]]
+
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    monkeypatch.setattr(settings, "retrieval_cache_ttl_seconds", 0)
+    monkeypatch.setattr(retrieve_module, "ensure_collection", lambda: None)
+    monkeypatch.setattr(retrieve_module, "get_qdrant_client", lambda: FakeClient())
+    monkeypatch.setattr(retrieve_module, "_encode_query", lambda *_: (0.0,))
+
+    chunks = retrieve("midterm schedule", top_k=2, course_id="zz999")
+    assert [chunk.id for chunk in chunks] == ["0", "1"]
+
+
+def test_stub_search_never_caches_rows_from_before_a_concurrent_delete():
+    import threading
+
+    from backend.app.rag import qdrant_utils
+
+    if not hasattr(qdrant_utils, "_InMemoryQdrantClient"):
+        pytest.skip("qdrant_client is installed; the in-memory stub is not defined")
+    m = qdrant_utils.qmodels
+    client = qdrant_utils._InMemoryQdrantClient()
+    client.recreate_collection("c", m.VectorParams(size=2, distance=m.Distance.COSINE))
+    client.upsert(
+        "c",
+        [
+            m.PointStruct(id=pid, vector=[1.0, float(idx)], payload={"course_id": pid[0]})
+            for idx, pid in enumerate(["a0", "b1", "b2"])
+        ],
+    )
+    by_course = lambda cid: m.Filter(must=[m.FieldCondition(key="course_id", match=m.MatchValue(value=cid))])
+    delete_a = threading.Thread(target=client.delete, args=("c", m.FilterSelector(filter=by_course("a"))))
+
+    class PausingIndex(dict):
+        def get(self, *args):
+            # A delete that gets in while the search resolves rows would shift them.
+            if delete_a.ident is None:
+                delete_a.start()
+                delete_a.join(0.2)
+            return super().get(*args)
+
+    client._collections["c"]["index"] = PausingIndex(client._collections["c"]["index"])
+    client.search("c", [1.0, 1.0], limit=5, with_payload=True, with_vectors=False, query_filter=by_course("b"))
+    delete_a.join()
+
+    hits = client.search("c", [1.0, 1.0], limit=5, with_payload=True, with_vectors=False, query_filter=by_course("b"))
+    assert sorted(hit.id for hit in hits) == ["b1", "b2"]
+
+
+def test_missing_collection_over_grpc_is_created(ingest_sample_corpus, monkeypatch):
+    from types import SimpleNamespace
+
+    from backend.app.rag import qdrant_utils
+
+    class FakeRpcError(Exception):
+        def __init__(self, code):
+            self._code = code
+
+        def code(self):
+            return self._code
+
+    class RestOnlyError(Exception):
+        """Stands in for qdrant_client's UnexpectedResponse, which gRPC errors do not subclass."""
+
+    class GrpcClient:
+        def __init__(self, status):
+            self.status = status
+            self.created = []
+
+        def get_collection(self, collection_name):
+            raise FakeRpcError(self.status)
+
+        def recreate_collection(self, collection_name, **_):
+            self.created.append(collection_name)
+
+    client = GrpcClient("NOT_FOUND")
+    fake_grpc = SimpleNamespace(RpcError=FakeRpcError, StatusCode=SimpleNamespace(NOT_FOUND="NOT_FOUND"))
+    monkeypatch.setattr(qdrant_utils, "grpc", fake_grpc)
+    monkeypatch.setattr(qdrant_utils, "UnexpectedResponse", RestOnlyError)
+    monkeypatch.setattr(qdrant_utils, "get_qdrant_client", lambda: client)
+    qdrant_utils.reset_collection_cache()
+    try:
+        assert qdrant_utils.ensure_collection() is True
+        assert client.created == [settings.qdrant_collection]
+
+        # Other gRPC failures are not mistaken for a missing collection.
+        client.status = "UNAVAILABLE"
+        qdrant_utils.reset_collection_cache()
+        with pytest.raises(FakeRpcError):
+            qdrant_utils.ensure_collection()
+    finally:
+        qdrant_utils.reset_collection_cache()